@@ -1,7 +1,10 @@
 import csv
+import logging
 import os
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 class OperationBancaire:
     def __init__(self, date_comptabilisation, libelle_simplifie, libelle_operation, 
                  reference, informations_complementaires, type_operation, 
@@ -46,69 +49,64 @@ class OperationBancaire:
                 })
         print(f"✅ Export terminé: {filename}")
     
+    # Colonnes du modèle et noms acceptés dans le fichier (après remplacement des espaces)
+    COLONNES_IMPORT = (
+        ('date_comptabilisation', ['date_comptabilisation', 'Date_de_comptabilisation', 'date', 'Date']),
+        ('libelle_simplifie', ['libelle_simplifie', 'Libelle_simplifie', 'libelle', 'Libelle']),
+        ('libelle_operation', ['libelle_operation', 'Libelle_operation']),
+        ('reference', ['reference', 'Reference', 'ref', 'Ref']),
+        ('informations_complementaires', ['informations_complementaires', 'Informations_complementaires', 'info', 'Info']),
+        ('type_operation', ['type_operation', 'Type_operation', 'type', 'Type']),
+        ('categorie', ['categorie', 'Categorie']),
+        ('sous_categorie', ['sous_categorie', 'Sous_categorie']),
+        ('debit', ['debit', 'Debit']),
+        ('credit', ['credit', 'Credit']),
+    )
+    
     @classmethod
     def import_from_csv(cls, filename):
         operations = []
         try:
             with open(filename, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                
-                # DEBUG: Afficher les colonnes originales
-                print(f"📋 Colonnes trouvées dans le fichier:")
-                for i, col in enumerate(reader.fieldnames, 1):
-                    print(f"  {i}. '{col}'")
+                reader = csv.reader(csvfile)
+                original_fieldnames = next(reader)
                 
                 # Remplacer les espaces par des underscores dans les noms de colonnes
-                original_fieldnames = reader.fieldnames.copy()
-                reader.fieldnames = [col.replace(' ', '_').strip() for col in reader.fieldnames]
+                fieldnames = [col.replace(' ', '_').strip() for col in original_fieldnames]
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Colonnes trouvées dans le fichier: %s", original_fieldnames)
+                    logger.debug("Colonnes après normalisation: %s", fieldnames)
+                
+                # Résoudre une fois pour toutes la position de chaque colonne
+                col_idx = {name: i for i, name in enumerate(fieldnames)}
                 
-                print(f"\n🔄 Colonnes après normalisation:")
-                for i, col in enumerate(reader.fieldnames, 1):
-                    print(f"  {i}. '{col}'")
+                def index_of(possible_names):
+                    for name in possible_names:
+                        if name in col_idx:
+                            return col_idx[name]
+                    return None
                 
-                for row_num, row in enumerate(reader, 1):
+                indices = [index_of(names) for _, names in cls.COLONNES_IMPORT]
+                width = len(fieldnames)
+                
+                rows = (row for row in reader if row)
+                for row_num, row in enumerate(rows, 1):
                     try:
-                        # DEBUG: Afficher la première ligne pour voir la structure
-                        if row_num == 1:
-                            print(f"\n📄 Première ligne de données:")
-                            for key, value in row.items():
-                                print(f"  '{key}': '{value}'")
-                        
-                        # Créer un nouveau dictionnaire avec les colonnes renommées
-                        new_row = {key.replace(' ', '_').strip(): value for key, value in row.items()}
-                        
-                        # Essayer de mapper les colonnes de façon flexible
-                        def get_value(possible_names):
-                            for name in possible_names:
-                                if name in new_row:
-                                    return new_row[name]
-                            return ""
-                        
-                        op = cls(
-                            date_comptabilisation=get_value(['date_comptabilisation', 'Date_de_comptabilisation', 'date', 'Date']),
-                            libelle_simplifie=get_value(['libelle_simplifie', 'Libelle_simplifie', 'libelle', 'Libelle']),
-                            libelle_operation=get_value(['libelle_operation', 'Libelle_operation']),
-                            reference=get_value(['reference', 'Reference', 'ref', 'Ref']),
-                            informations_complementaires=get_value(['informations_complementaires', 'Informations_complementaires', 'info', 'Info']),
-                            type_operation=get_value(['type_operation', 'Type_operation', 'type', 'Type']),
-                            categorie=get_value(['categorie', 'Categorie']),
-                            sous_categorie=get_value(['sous_categorie', 'Sous_categorie']),
-                            debit=get_value(['debit', 'Debit']),
-                            credit=get_value(['credit', 'Credit'])
-                        )
+                        if len(row) < width:
+                            row = row + [None] * (width - len(row))
+                        op = cls(*[row[i] if i is not None else "" for i in indices])
                         operations.append(op)
                         
-                    except Exception as e:
-                        print(f"❌ Erreur ligne {row_num}: {e}")
+                    except Exception:
+                        logger.exception("Erreur ligne %d", row_num)
                         continue
                 
                 print(f"\n✅ {len(operations)} opérations traitées")
                 
             return operations
-        except Exception as e:
-            print(f"❌ Erreur: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Erreur lors de l'import de %s", filename)
             return []
 
 class MenuImport:
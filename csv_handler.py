@@ -1,7 +1,15 @@
 import csv
+import io
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from itertools import count
+from operator import attrgetter
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from models import OperationBancaire
 from utils import normalize_header, detect_dialect
@@ -17,7 +25,34 @@ _DATE_FORMATS = [
     "%Y/%m/%d",
 ]
 
+_SHORT_DATE_RE = re.compile(r"[ T].*$")
 
+
+_SHAPE_TABLE = str.maketrans("0123456789", "N" * 10)
+
+
+def _build_shape_table() -> Dict[str, str]:
+    """Forme de la chaîne (chiffres -> N) -> premier format numérique qui la produit."""
+
+    widths = {"%d": ("N", "NN"), "%m": ("N", "NN"), "%Y": ("NNNN",)}
+    table: Dict[str, str] = {}
+    for fmt in _DATE_FORMATS:
+        parts = re.split(r"(%[a-zA-Z])", fmt)
+        if any(p.startswith("%") and p not in widths for p in parts):
+            continue  # formats à noms de mois : laissés à la cascade
+        shapes = [""]
+        for part in parts:
+            options = widths.get(part, (part,))
+            shapes = [shape + option for shape in shapes for option in options]
+        for shape in shapes:
+            table.setdefault(shape, fmt)
+    return table
+
+
+_SHAPE_TO_FMT = _build_shape_table()
+
+
+@lru_cache(maxsize=8192)
 def parse_date(raw: str) -> str:
     """Convertit une date brute en format ISO (yyyy-mm-dd) si possible."""
 
@@ -25,12 +60,29 @@ def parse_date(raw: str) -> str:
     if not value:
         return ""
 
+    # Déjà au format ISO : rien à convertir.
+    if (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value.isascii()
+        and (value[:4] + value[5:7] + value[8:]).isdigit()
+    ):
+        return value
+
     candidates = [value]
-    short = re.sub(r"[ T].*$", "", value)
+    short = _SHORT_DATE_RE.sub("", value)
     if short and short not in candidates:
         candidates.append(short)
 
     for candidate in candidates:
+        # Format déduit de la forme de la chaîne ; la cascade ne sert qu'aux cas exotiques.
+        probe = _SHAPE_TO_FMT.get(candidate.translate(_SHAPE_TABLE))
+        if probe:
+            try:
+                return datetime.strptime(candidate, probe).date().isoformat()
+            except ValueError:
+                pass
         for fmt in _DATE_FORMATS:
             try:
                 return datetime.strptime(candidate, fmt).date().isoformat()
@@ -45,9 +97,12 @@ def parse_date(raw: str) -> str:
     return value  # On conserve la valeur d'origine si non reconnue.
 
 
-_AMOUNT_SEP_RE = re.compile(r"[ \u00A0]")
+# Séparateur décimal retenu après le balayage : l'autre est un séparateur de milliers.
+_COMMA_DECIMAL = str.maketrans({",": ".", ".": None})
+_DOT_DECIMAL = str.maketrans({",": None})
 
 
+@lru_cache(maxsize=8192)
 def parse_amount(raw: str) -> Optional[float]:
     """Nettoie et convertit un montant vers un float."""
 
@@ -58,21 +113,34 @@ def parse_amount(raw: str) -> Optional[float]:
     if not value:
         return None
 
-    negative = False
-    if value.startswith("(") and value.endswith(")"):
-        negative = True
+    negative = value[0] == "(" and value[-1] == ")"
+    if negative:
         value = value[1:-1]
 
-    value = _AMOUNT_SEP_RE.sub("", value)
+    # Un seul balayage : on garde chiffres, signes et séparateurs, en notant la
+    # position des derniers séparateurs pour trancher la décimale ensuite.
+    kept: List[str] = []
+    commas: int = 0
+    dots: int = 0
+    last_comma: int = -1
+    last_dot: int = -1
+    for ch in value:
+        if ch == ",":
+            commas += 1
+            last_comma = len(kept)
+            kept.append(ch)
+        elif ch == ".":
+            dots += 1
+            last_dot = len(kept)
+            kept.append(ch)
+        elif ch.isdecimal() or ch == "-" or ch == "+":
+            kept.append(ch)
+    value = "".join(kept)
 
     # Gestion des décimales à la française.
-    if "," in value and value.count(",") == 1 and "." not in value:
-        value = value.replace(",", ".")
-    if "," in value and "." in value and value.rfind(",") > value.rfind("."):
-        value = value.replace(".", "")
-        value = value.replace(",", ".")
-
-    value = re.sub(r"[^\d\.\-+]", "", value)
+    if commas:
+        comma_is_decimal = last_comma > last_dot if dots else commas == 1
+        value = value.translate(_COMMA_DECIMAL if comma_is_decimal else _DOT_DECIMAL)
     if value in {"", "-", "+"}:
         return None
 
@@ -142,104 +210,323 @@ HEADER_ALIASES: Dict[str, set[str]] = {
 }
 
 
+# Index inverse calculé une fois : alias normalisé -> champ interne.
+_ALIAS_TO_INTERNAL: Dict[str, str] = {
+    normalize_header(alias): internal
+    for internal, aliases in HEADER_ALIASES.items()
+    for alias in aliases
+}
+
+
 def map_headers_to_fields(norm_headers: List[str]) -> Dict[str, str]:
     """Associe les colonnes normalisées aux champs internes."""
 
     found: Dict[str, str] = {}
-    available = set(norm_headers)
-    for internal, aliases in HEADER_ALIASES.items():
-        for alias in aliases:
-            normalized = normalize_header(alias)
-            if normalized in available:
-                found[internal] = normalized
-                break
+    for header in norm_headers:
+        internal = _ALIAS_TO_INTERNAL.get(header)
+        if internal is not None:
+            # Plusieurs alias présents : la première colonne du fichier l'emporte.
+            found.setdefault(internal, header)
     return found
 
+# Ordre de dépaquetage des valeurs brutes dans la boucle d'import.
+_IMPORT_FIELDS = (
+    "date_comptabilisation", "libelle_simplifie", "libelle_operation",
+    "reference", "informations_complementaires", "type_operation",
+    "categorie", "sous_categorie", "debit", "credit", "montant",
+)
+
+_READ_BUFFER_SIZE = 1 << 20  # lectures de 1 Mio : moins d'appels système sur les gros relevés
+_WRITE_BUFFER_SIZE = 1 << 20  # idem à l'export : un write() par mégaoctet écrit
+
+# Dialectes déjà détectés, par (chemin, mtime, taille) ; les plus anciens sont évincés.
+_DIALECT_CACHE: Dict[Tuple[str, int, int], csv.Dialect] = {}
+_DIALECT_CACHE_SIZE = 64
+
+
+def _dialect_for(path: str, f: Optional[IO[str]] = None) -> csv.Dialect:
+    """Dialecte du fichier, re-détecté seulement si le fichier a changé (mtime/taille).
+
+    Si l'appelant a déjà ouvert le fichier, l'échantillon est lu sur ce descripteur
+    (puis rembobiné) au lieu de rouvrir le chemin.
+    """
+
+    st = os.stat(path) if f is None else os.fstat(f.fileno())
+    key = (path, st.st_mtime_ns, st.st_size)
+    dialect = _DIALECT_CACHE.get(key)
+    if dialect is None:
+        if len(_DIALECT_CACHE) >= _DIALECT_CACHE_SIZE:
+            del _DIALECT_CACHE[next(iter(_DIALECT_CACHE))]
+        dialect = _DIALECT_CACHE[key] = detect_dialect(path if f is None else f)
+    return dialect
+
+
+def _resolve_header(reader) -> Tuple[List[str], Dict[str, int]]:
+    """Lit l'en-tête et renvoie (en-têtes d'origine, position de chaque champ interne)."""
+
+    original_headers = next(reader, None)
+    if not original_headers:
+        raise ValueError("Aucune colonne détectée (vérifie le fichier).")
+    norm_headers = [normalize_header(h) for h in original_headers]
+    field_map = map_headers_to_fields(norm_headers)
+    # Position de chaque champ interne ; en cas de doublon, la dernière colonne l'emporte.
+    header_index = {h: i for i, h in enumerate(norm_headers)}
+    field_index = {internal: header_index[key] for internal, key in field_map.items()}
+    return original_headers, field_index
+
+
+def _split_amounts(
+    debit_val: Optional[float], credit_val: Optional[float], montant_raw: str
+) -> Tuple[Optional[float], Optional[float]]:
+    """Débit/crédit positifs ; à défaut, répartit la colonne montant selon son signe."""
+
+    if debit_val is not None and debit_val < 0:
+        debit_val = abs(debit_val)
+    if credit_val is not None and credit_val < 0:
+        credit_val = abs(credit_val)
+
+    if debit_val is None and credit_val is None and montant_raw:
+        montant_val = parse_amount(montant_raw)
+        if montant_val is not None:
+            if montant_val < 0:
+                debit_val = abs(montant_val)
+            elif montant_val > 0:
+                credit_val = montant_val
+            else:
+                debit_val = credit_val = 0.0
+    return debit_val, credit_val
+
+
+def _collect_raw_columns(
+    reader, original_headers: List[str], field_index: Dict[str, int]
+) -> List[List[str]]:
+    """Regroupe les valeurs brutes des lignes du lecteur, une liste par champ de _IMPORT_FIELDS."""
+
+    columns: List[List[str]] = [[] for _ in _IMPORT_FIELDS]
+    appenders = [
+        (column.append, field_index[field])
+        for column, field in zip(columns, _IMPORT_FIELDS)
+        if field in field_index
+    ]
+    width = len(original_headers)
+    n_rows = 0
+
+    # Lignes complétées à la largeur de l'en-tête : le corps ne peut pas lever ;
+    # les erreurs du lecteur CSV remontent telles quelles.
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row += [""] * (width - len(row))
+        for append, i in appenders:
+            append(row[i].strip())
+        n_rows += 1
+
+    # Colonnes absentes du fichier : valeurs vides.
+    for k, field in enumerate(_IMPORT_FIELDS):
+        if field not in field_index:
+            columns[k] = [""] * n_rows
+    return columns
+
+
+def _read_raw_columns(path: str) -> List[List[str]]:
+    """Lit le CSV et renvoie les valeurs brutes, une liste par champ de _IMPORT_FIELDS."""
+
+    with open(
+        path, "r", encoding="utf-8", errors="replace", newline="", buffering=_READ_BUFFER_SIZE
+    ) as f:
+        reader = csv.reader(f, dialect=_dialect_for(path, f))
+        original_headers, field_index = _resolve_header(reader)
+        return _collect_raw_columns(reader, original_headers, field_index)
+
+
+def _type_columns(raw_columns: List[List[str]]) -> Dict[str, list]:
+    """Convertit les colonnes brutes de _read_raw_columns en colonnes typées (champ -> liste)."""
+
+    (
+        dates, libelles_simpl, libelles_op, references, infos,
+        types_operation, categories, sous_categories,
+        debits_raw, credits_raw, montants_raw,
+    ) = raw_columns
+
+    # Conversion colonne par colonne : une seule boucle en C par champ typé.
+    dates = list(map(parse_date, dates))
+    debits = list(map(parse_amount, debits_raw))
+    credits = list(map(parse_amount, credits_raw))
+
+    for i, montant_raw in enumerate(montants_raw):
+        debits[i], credits[i] = _split_amounts(debits[i], credits[i], montant_raw)
+
+    libelles_simpl = [simpl or op for simpl, op in zip(libelles_simpl, libelles_op)]
+    # Colonnes à faible cardinalité : une seule instance par valeur distincte.
+    types_operation = list(map(sys.intern, types_operation))
+    categories = list(map(sys.intern, categories))
+    sous_categories = list(map(sys.intern, sous_categories))
+
+    return dict(zip(_IMPORT_FIELDS, (
+        dates, libelles_simpl, libelles_op, references, infos,
+        types_operation, categories, sous_categories, debits, credits,
+    )))
+
+
+def import_columns_from_csv(path: str) -> Dict[str, list]:
+    """Importe le CSV en colonnes typées (champ -> liste), sans créer d'OperationBancaire."""
+
+    return _type_columns(_read_raw_columns(path))
+
+
+_PARALLEL_MIN_SIZE = 8 << 20  # en dessous, démarrer des processus coûte plus que le parsing
+_DIALECT_ATTRS = (
+    "delimiter", "quotechar", "escapechar", "doublequote",
+    "skipinitialspace", "lineterminator", "quoting", "strict",
+)
+
+
+def _next_record_start(mm: mmap.mmap, pos: int, quotes: int, quotechar: bytes) -> Tuple[int, int]:
+    """Début de la ligne suivant pos hors champ entre guillemets (parité des guillemets vus)."""
+
+    while True:
+        nl = mm.find(b"\n", pos)
+        if nl < 0:
+            return len(mm), quotes
+        quotes += mm[pos:nl].count(quotechar)
+        pos = nl + 1
+        if quotes % 2 == 0:
+            return pos, quotes
+
+
+def _import_chunk(
+    path: str, start: int, end: int, fmtparams: dict,
+    original_headers: List[str], field_index: Dict[str, int],
+) -> Dict[str, list]:
+    """Tâche d'un processus : parse les lignes de la plage d'octets [start, end)."""
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode("utf-8", errors="replace")
+    reader = csv.reader(io.StringIO(text, newline=""), **fmtparams)
+    return _type_columns(_collect_raw_columns(reader, original_headers, field_index))
+
+
+def import_columns_from_csv_parallel(path: str, workers: Optional[int] = None) -> Dict[str, list]:
+    """Variante multi-processus d'import_columns_from_csv pour les gros fichiers.
+
+    Le fichier est projeté en mémoire puis découpé en plages d'octets de tailles voisines,
+    coupées sur des fins de ligne hors guillemets ; chaque plage est parsée par un processus.
+    Le résultat est identique à celui de l'import séquentiel ; les erreurs du lecteur CSV
+    remontent telles quelles, sans numéro de ligne du fichier.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    dialect = _dialect_for(path)
+    quotechar = dialect.quotechar
+    size = os.path.getsize(path)
+    # Parité des guillemets fiable seulement avec le guillemetage CSV standard.
+    if (
+        workers < 2 or size < _PARALLEL_MIN_SIZE or not quotechar or dialect.escapechar
+        or dialect.quoting == csv.QUOTE_NONE or len(quotechar.encode("utf-8")) != 1
+    ):
+        return import_columns_from_csv(path)
+
+    q = quotechar.encode("utf-8")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header_end, quotes = _next_record_start(mm, 0, 0, q)
+        header_text = mm[:header_end].decode("utf-8", errors="replace")
+        bounds = []
+        start = header_end
+        step = (size - header_end) // workers + 1
+        while start < size:
+            target = max(start, min(size, start + step))
+            quotes += mm[start:target].count(q)
+            end, quotes = _next_record_start(mm, target, quotes, q)
+            bounds.append((start, end))
+            start = end
+
+    if quotes % 2:
+        # Guillemets isolés dans des champs non cités : découpage non sûr.
+        return import_columns_from_csv(path)
+    original_headers, field_index = _resolve_header(csv.reader(io.StringIO(header_text, newline=""), dialect=dialect))
+    # Le dialecte détecté (classe locale du Sniffer) ne se sérialise pas : on transmet ses attributs.
+    fmtparams = {attr: getattr(dialect, attr) for attr in _DIALECT_ATTRS if hasattr(dialect, attr)}
+    with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as pool:
+        futures = [
+            pool.submit(_import_chunk, path, start, end, fmtparams, original_headers, field_index)
+            for start, end in bounds
+        ]
+        parts = [future.result() for future in futures]
+
+    columns: Dict[str, list] = {field: [] for field in _IMPORT_FIELDS[:-1]}
+    for part in parts:
+        for field, values in part.items():
+            columns[field].extend(values)
+    return columns
+
+
 def import_operations_from_csv(path: str) -> List[OperationBancaire]:
-    operations: List[OperationBancaire] = []
-    dialect = detect_dialect(path)
-    with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
-        reader = csv.DictReader(f, dialect=dialect)
-        if not reader.fieldnames:
-            raise ValueError("Aucune colonne détectée (vérifie le fichier).")
-        original_headers = reader.fieldnames[:]
-        norm_headers = [normalize_header(h) for h in original_headers]
-        field_map = map_headers_to_fields(norm_headers)
-
-        def get_value(field: str) -> str:
-            key = field_map.get(field)
-            return row_norm.get(key, "") if key else ""
-
-        for idx, raw_row in enumerate(reader, start=2):
+    # Construction positionnelle : pas de dict de mots-clés par opération.
+    return list(map(OperationBancaire, *import_columns_from_csv(path).values()))
+
+
+def _parse_row(row: List[str], indices: Tuple[Optional[int], ...]) -> OperationBancaire:
+    (
+        date_raw, libelle_simpl, libelle_op, reference, infos,
+        type_operation, categorie, sous_categorie,
+        debit_raw, credit_raw, montant_raw,
+    ) = [row[i].strip() if i is not None else "" for i in indices]
+    debit_val, credit_val = _split_amounts(
+        parse_amount(debit_raw), parse_amount(credit_raw), montant_raw
+    )
+    return OperationBancaire(
+        parse_date(date_raw), libelle_simpl or libelle_op, libelle_op, reference, infos,
+        sys.intern(type_operation), sys.intern(categorie), sys.intern(sous_categorie),
+        debit_val, credit_val,
+    )
+
+
+def iter_operations_from_csv(path: str) -> Iterator[OperationBancaire]:
+    """Variante paresseuse de import_operations_from_csv : une opération à la fois."""
+
+    with open(
+        path, "r", encoding="utf-8", errors="replace", newline="", buffering=_READ_BUFFER_SIZE
+    ) as f:
+        reader = csv.reader(f, dialect=_dialect_for(path, f))
+        original_headers, field_index = _resolve_header(reader)
+        indices = tuple(field_index.get(field) for field in _IMPORT_FIELDS)
+        width = len(original_headers)
+
+        rows = (row for row in reader if row)
+        for idx, row in enumerate(rows, start=2):
             try:
-                row_norm = {
-                    normalize_header(k): (v or "").strip()
-                    for k, v in (raw_row or {}).items()
-                }
-
-                date_iso = parse_date(get_value("date_comptabilisation"))
-                libelle_simpl = get_value("libelle_simplifie")
-                libelle_op = get_value("libelle_operation")
-                reference = get_value("reference")
-                infos = get_value("informations_complementaires")
-                type_operation = get_value("type_operation")
-                categorie = get_value("categorie")
-                sous_categorie = get_value("sous_categorie")
-                debit_val = parse_amount(get_value("debit"))
-                credit_val = parse_amount(get_value("credit"))
-                montant_raw = get_value("montant")
-
-                if debit_val is not None and debit_val < 0:
-                    debit_val = abs(debit_val)
-                if credit_val is not None and credit_val < 0:
-                    credit_val = abs(credit_val)
-
-                if debit_val is None and credit_val is None and montant_raw:
-                    montant_val = parse_amount(montant_raw)
-                    if montant_val is not None:
-                        if montant_val < 0:
-                            debit_val = abs(montant_val)
-                            credit_val = None
-                        elif montant_val > 0:
-                            credit_val = montant_val
-                            debit_val = None
-                        else:
-                            debit_val = credit_val = 0.0
-
-                libelle_simpl = libelle_simpl or libelle_op
-
-                operations.append(
-                    OperationBancaire(
-                        date_comptabilisation=date_iso,
-                        libelle_simplifie=libelle_simpl,
-                        libelle_operation=libelle_op,
-                        reference=reference,
-                        informations_complementaires=infos,
-                        type_operation=type_operation,
-                        categorie=categorie,
-                        sous_categorie=sous_categorie,
-                        debit=debit_val,
-                        credit=credit_val,
-                    )
-                )
+                if len(row) < width:
+                    row += [""] * (width - len(row))
+                op = _parse_row(row, indices)
             except Exception as exc:
-                preview = {
-                    k: (v if v is not None else "")
-                    for k, v in (raw_row or {}).items()
-                }
+                preview = dict(zip(original_headers, row))
                 raise RuntimeError(
                     f"Erreur à la ligne {idx}: {exc}\n  Aperçu: {preview}"
                 ) from exc
-    return operations
+            yield op
 
-def export_operations_to_csv(operations: List[OperationBancaire], path: str):
-    fieldnames = [
-        "date_comptabilisation", "libelle_simplifie", "libelle_operation",
-        "reference", "informations_complementaires", "type_operation",
-        "categorie", "sous_categorie", "debit", "credit"
-    ]
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for op in operations:
-            writer.writerow(op.to_dict_export())
+_EXPORT_ATTRS = (
+    "date_comptabilisation", "libelle_simplifie", "libelle_operation",
+    "reference", "informations_complementaires", "type_operation",
+    "categorie", "sous_categorie", "debit", "credit",
+)
+
+
+def _fmt_export(value: Optional[float]) -> str:
+    return "" if value is None else f"{value:.2f}"
+
+
+def export_operations_to_csv(operations: Iterable[OperationBancaire], path: str) -> int:
+    """Écrit les opérations (liste ou flux) et renvoie le nombre de lignes écrites."""
+
+    get_row = attrgetter(*_EXPORT_ATTRS)
+    written = count()
+    with open(path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(_EXPORT_ATTRS)
+        writer.writerows(
+            row[:8] + (_fmt_export(row[8]), _fmt_export(row[9]))
+            for row, _ in zip(map(get_row, operations), written)
+        )
+    return next(written)
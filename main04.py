@@ -8,6 +8,8 @@ Usage (interactive menu):
 
 Usage (batch import + export):
     python main_fixed.py --in input.csv --out cleaned.csv
+    python main04.py --in-many a.csv b.csv --out-dir cleaned/
+    python main04.py --in input.csv --aggregate
 
 Key features:
 - Auto-detect delimiter (",", ";", "|", TAB) with safe fallback.
@@ -26,23 +28,42 @@ import os
 import re
 import sys
 import unicodedata
-from collections import defaultdict
-from dataclasses import dataclass, asdict
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from itertools import starmap
+from operator import attrgetter
+from typing import Iterator, List, Optional, Tuple
 
 # ---------------------- Utils ----------------------
 
+class _MarkDeleter(dict):
+    """Table str.translate qui supprime les diacritiques (catégorie Mn), remplie à la demande."""
+
+    def __missing__(self, cp: int):
+        value = self[cp] = None if unicodedata.category(chr(cp)) == "Mn" else cp
+        return value
+
+_STRIP_MARKS = _MarkDeleter()
+
 def strip_accents(s: str) -> str:
     if s is None:
         return ""
-    return "".join(c for c in unicodedata.normalize("NFD", str(s)) if unicodedata.category(c) != "Mn")
+    s = str(s)
+    if s.isascii():
+        return s
+    return unicodedata.normalize("NFD", s).translate(_STRIP_MARKS)
 
+# Espaces/ponctuation et underscores consécutifs -> un seul underscore
+_HEADER_SEP_RE = re.compile(r"[\W_]+")
+
+@lru_cache(maxsize=256)
 def normalize_header(h: str) -> str:
     h = strip_accents(h).lower().strip()
-    h = re.sub(r"[^\w]+", "_", h)  # spaces/punct -> underscore
-    h = re.sub(r"_+", "_", h).strip("_")
-    return h
+    return _HEADER_SEP_RE.sub("_", h).strip("_")
 
 def detect_dialect(path: str) -> csv.Dialect:
     with open(path, "r", encoding="utf-8", errors="replace") as f:
@@ -68,45 +89,120 @@ _DATE_FORMATS = [
     "%d %m %Y", "%d %b %Y", "%d %B %Y", "%Y/%m/%d",
 ]
 
+# Dernier format reconnu : les relevés utilisent presque toujours un seul format
+_last_good_fmt = [_DATE_FORMATS[0]]
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _fast_parse_date(s: str) -> Optional[str]:
+    """Formats numériques de _DATE_FORMATS sans strptime ; None si la forme n'est pas reconnue."""
+    if not 8 <= len(s) <= 10 or not s.isascii():
+        return None
+    for sep in "/-. ":
+        if sep in s:
+            break
+    else:
+        return None
+    parts = s.split(sep)
+    if len(parts) != 3 or not (parts[0].isdigit() and parts[1].isdigit() and parts[2].isdigit()):
+        return None
+    a, m, b = parts
+    if len(a) == 4 and sep in "/-":      # %Y-%m-%d, %Y/%m/%d
+        y, d = a, b
+    elif len(b) == 4:                     # %d/%m/%Y, %d-%m-%Y, %d.%m.%Y, %d %m %Y
+        y, d = b, a
+    else:
+        return None
+    if len(d) > 2 or len(m) > 2:
+        return None
+    yi, mi, di = int(y), int(m), int(d)
+    if yi < 1 or not 1 <= mi <= 12 or di < 1:
+        return None
+    leap = mi == 2 and yi % 4 == 0 and (yi % 100 != 0 or yi % 400 == 0)
+    if di > _DAYS_IN_MONTH[mi] + leap:
+        return None
+    return f"{yi:04d}-{mi:02d}-{di:02d}"
+
+@lru_cache(maxsize=8192)
 def parse_date(s: str) -> str:
     s = (s or "").strip()
     if not s:
         return ""
+    fast = _fast_parse_date(s)
+    if fast is not None:
+        return fast
+    strptime = datetime.strptime
+    try:
+        return strptime(s, _last_good_fmt[0]).date().isoformat()
+    except ValueError:
+        pass
     for fmt in _DATE_FORMATS:
         try:
-            return datetime.strptime(s, fmt).date().isoformat()
-        except Exception:
-            pass
-    s2 = re.sub(r"[ T].*$", "", s)
+            d = strptime(s, fmt).date()
+        except ValueError:
+            continue
+        _last_good_fmt[0] = fmt
+        return d.isoformat()
+    s2 = s.split(" ", 1)[0].split("T", 1)[0]
     for fmt in _DATE_FORMATS:
         try:
-            return datetime.strptime(s2, fmt).date().isoformat()
-        except Exception:
+            return strptime(s2, fmt).date().isoformat()
+        except ValueError:
             pass
     try:
         return datetime.fromisoformat(s2).date().isoformat()
-    except Exception:
+    except ValueError:
         return s  # keep raw if unknown
 
-_AMOUNT_SEP_RE = re.compile(r"[ \u00A0]")
+_AMOUNT_TRANS = str.maketrans({" ": "", "\u00A0": "", ",": "."})
+# Séparateur décimal retenu après le balayage : l'autre est un séparateur de milliers
+_COMMA_DECIMAL = str.maketrans({",": ".", ".": None})
+_DOT_DECIMAL = str.maketrans({",": None})
 
 def parse_amount(raw: str) -> Optional[float]:
     if raw is None:
         return None
-    s = str(raw).strip()
+    return _parse_amount_str(str(raw).strip())
+
+@lru_cache(maxsize=8192)
+def _parse_amount_str(s: str) -> Optional[float]:
+    # Mémoïsé : abonnements et frais récurrents répètent les mêmes montants
     if not s:
         return None
-    negative = False
-    if s.startswith("(") and s.endswith(")"):
-        negative = True
+    negative = s[0] == "(" and s[-1] == ")"
+    if negative:
         s = s[1:-1]
-    s = _AMOUNT_SEP_RE.sub("", s)
-    if "," in s and s.count(",") == 1 and s.count(".") == 0:
-        s = s.replace(",", ".")
-    if "," in s and "." in s and s.rfind(",") > s.rfind("."):
-        s = s.replace(".", "")
-        s = s.replace(",", ".")
-    s = re.sub(r"[^\d\.\-+]", "", s)
+    # Fast path: plain digits with at most one separator ("-22,99", "1 234.56")
+    fast = s.translate(_AMOUNT_TRANS)
+    digits = fast[1:] if fast[:1] in ("-", "+") else fast
+    if digits.replace(".", "", 1).isdigit():
+        try:
+            val = float(fast)
+            return -abs(val) if negative else val
+        except ValueError:
+            pass
+    # Slow path: un seul balayage qui ne garde que chiffres, signes et séparateurs
+    kept = []
+    commas = dots = 0
+    last_comma = last_dot = -1
+    for ch in s:
+        if ch == ",":
+            commas += 1
+            last_comma = len(kept)
+            kept.append(ch)
+        elif ch == ".":
+            dots += 1
+            last_dot = len(kept)
+            kept.append(ch)
+        elif ch.isdecimal() or ch == "-" or ch == "+":
+            kept.append(ch)
+    s = "".join(kept)
+    if commas:
+        if dots:
+            comma_is_decimal = last_comma > last_dot
+        else:
+            comma_is_decimal = commas == 1
+        s = s.translate(_COMMA_DECIMAL if comma_is_decimal else _DOT_DECIMAL)
     if s in ("", "-", "+"):
         return None
     try:
@@ -117,7 +213,7 @@ def parse_amount(raw: str) -> Optional[float]:
 
 # ---------------------- Model ----------------------
 
-@dataclass
+@dataclass(slots=True)
 class OperationBancaire:
     date_comptabilisation: str = ""
     libelle_simplifie: str = ""
@@ -131,13 +227,20 @@ class OperationBancaire:
     credit: Optional[float] = None
 
     def to_dict_export(self):
-        d = asdict(self)
-        if d["debit"] is not None:
-            d["debit"] = f"{d['debit']:.2f}"
-        if d["credit"] is not None:
-            d["credit"] = f"{d['credit']:.2f}"
+        # Sans asdict() : pas de copie récursive par opération
+        d = {field: getattr(self, field) for field in _FIELDS}
+        if self.debit is not None:
+            d["debit"] = f"{self.debit:.2f}"
+        if self.credit is not None:
+            d["credit"] = f"{self.credit:.2f}"
         return d
 
+_FIELDS = (
+    "date_comptabilisation", "libelle_simplifie", "libelle_operation",
+    "reference", "informations_complementaires", "type_operation",
+    "categorie", "sous_categorie", "debit", "credit",
+)
+
 # Header aliases
 HEADER_ALIASES = {
     "date_comptabilisation": {"date_comptabilisation", "date", "date_operation", "date_valeur", "date_de_comptabilisation"},
@@ -153,118 +256,274 @@ HEADER_ALIASES = {
     "montant": {"montant", "amount", "valeur"},
 }
 
-def map_headers_to_fields(norm_headers: List[str]) -> dict:
-    set_headers = set(norm_headers)
+# Index inversé : alias normalisé -> champ interne
+_ALIAS_TO_INTERNAL = {
+    normalize_header(alias): internal
+    for internal, aliases in HEADER_ALIASES.items()
+    for alias in aliases
+}
+
+@lru_cache(maxsize=64)
+def map_headers_to_fields(norm_headers: Tuple[str, ...]) -> dict:
+    """Associe chaque champ interne à la première colonne (ordre du fichier) qui lui correspond."""
     mapping = {}
-    for internal, aliases in HEADER_ALIASES.items():
-        for alias in aliases:
-            n = normalize_header(alias)
-            if n in set_headers:
-                mapping[internal] = n
-                break
+    for h in norm_headers:
+        internal = _ALIAS_TO_INTERNAL.get(h)
+        if internal is not None:
+            mapping.setdefault(internal, h)
     return mapping
 
 # ---------------------- Aggregation ----------------------
 
+@dataclass
+class OperationsTable:
+    """Stockage en colonnes (SoA) des montants et des catégories encodées en entiers."""
+    debit: array
+    credit: array
+    cat_codes: array
+    cat_labels: List[str]
+    sous_cat_codes: array
+    sous_cat_labels: List[str]
+
+    def __len__(self) -> int:
+        return len(self.debit)
+
+    @classmethod
+    def from_operations(cls, operations) -> "OperationsTable":
+        ops = list(operations)
+        return cls.from_columns(
+            debit=[op.debit for op in ops],
+            credit=[op.credit for op in ops],
+            categorie=[op.categorie for op in ops],
+            sous_categorie=[op.sous_categorie for op in ops],
+        )
+
+    @classmethod
+    def from_columns(cls, debit, credit, categorie, sous_categorie) -> "OperationsTable":
+        cat_codes, cat_labels = _factorize([c or "Non catégorisé" for c in categorie])
+        sous_codes, sous_labels = _factorize([c or "Non spécifié" for c in sous_categorie])
+        return cls(
+            debit=array("d", [0.0 if d is None else d for d in debit]),
+            credit=array("d", [0.0 if c is None else c for c in credit]),
+            cat_codes=cat_codes,
+            cat_labels=cat_labels,
+            sous_cat_codes=sous_codes,
+            sous_cat_labels=sous_labels,
+        )
+
+class OperationsView(Sequence):
+    """Séquence d'OperationBancaire construites à la demande à partir des colonnes importées."""
+
+    def __init__(self, columns: dict):
+        self._columns = [columns[field] for field in _FIELDS]
+        self._table: Optional[OperationsTable] = None
+
+    @classmethod
+    def empty(cls) -> "OperationsView":
+        return cls({field: [] for field in _FIELDS})
+
+    def extend(self, operations) -> None:
+        """Ajoute des opérations (vue ou itérable d'OperationBancaire) colonne par colonne."""
+        if isinstance(operations, OperationsView):
+            new_columns = operations._columns
+        else:
+            ops = list(operations)
+            new_columns = [list(map(attrgetter(field), ops)) for field in _FIELDS]
+        for col, new in zip(self._columns, new_columns):
+            col.extend(new)
+        self._table = None
+
+    def clear(self) -> None:
+        for col in self._columns:
+            col.clear()
+        self._table = None
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return OperationBancaire(*(col[i] for col in self._columns))
+
+    def __iter__(self) -> Iterator[OperationBancaire]:
+        return map(OperationBancaire, *self._columns)
+
+    @property
+    def table(self) -> OperationsTable:
+        """Table SoA des montants et catégories, construite une seule fois."""
+        if self._table is None:
+            columns = dict(zip(_FIELDS, self._columns))
+            self._table = OperationsTable.from_columns(
+                columns["debit"], columns["credit"], columns["categorie"], columns["sous_categorie"]
+            )
+        return self._table
+
+def _factorize(values: List[str]) -> Tuple[array, List[str]]:
+    """Encode des libellés en codes entiers (ordre de première apparition)."""
+    labels = list(dict.fromkeys(values))
+    index = {label: i for i, label in enumerate(labels)}
+    return array("l", map(index.__getitem__, values)), labels
+
+def _group_sum(codes: array, debit: array, credit: array, n: int) -> Tuple[list, list, list]:
+    """Noyau groupby-sum : débits, crédits et effectifs par code, en une seule passe."""
+    totals_d = [0.0] * n
+    totals_c = [0.0] * n
+    counts = [0] * n
+    for code, d, c in zip(codes, debit, credit):
+        totals_d[code] += d
+        totals_c[code] += c
+        counts[code] += 1
+    return totals_d, totals_c, counts
+
+def _agreger_codes(codes: array, labels: List[str], debit: array, credit: array) -> dict:
+    totals_d, totals_c, counts = _group_sum(codes, debit, credit, len(labels))
+    return {
+        label: {'total_debit': d, 'total_credit': c, 'nombre': k}
+        for label, d, c, k in zip(labels, totals_d, totals_c, counts)
+    }
+
+def _agreger_objets(operations, get_key, defaut: str) -> dict:
+    """Agrégation en une passe sur des OperationBancaire (accumulateurs [débit, crédit, nombre])."""
+    agg = {}
+    for op in operations:
+        key = get_key(op) or defaut
+        row = agg.get(key)
+        if row is None:
+            row = agg[key] = [0.0, 0.0, 0]
+        d = op.debit
+        if d is not None:
+            row[0] += d
+        c = op.credit
+        if c is not None:
+            row[1] += c
+        row[2] += 1
+    return _as_agregation(agg)
+
+def _table_of(operations) -> Optional[OperationsTable]:
+    if isinstance(operations, OperationsTable):
+        return operations
+    if isinstance(operations, OperationsView):
+        return operations.table
+    return None
+
 def agreger_par_categorie(operations):
     """Agrège les montants par catégorie (ex: Carrefour, PAYPAL...)"""
-    agregation = defaultdict(lambda: {'total_debit': 0.0, 'total_credit': 0.0, 'nombre': 0})
-    
-    for op in operations:
-        categorie = op.categorie or "Non catégorisé"
-        
-        if op.debit:
-            agregation[categorie]['total_debit'] += op.debit
-        if op.credit:
-            agregation[categorie]['total_credit'] += op.credit
-            
-        agregation[categorie]['nombre'] += 1
-    
-    return dict(agregation)
+    table = _table_of(operations)
+    if table is None:
+        return _agreger_objets(operations, attrgetter("categorie"), "Non catégorisé")
+    return _agreger_codes(table.cat_codes, table.cat_labels, table.debit, table.credit)
 
 def agreger_par_sous_categorie(operations):
     """Agrège les montants par sous-catégorie"""
-    agregation = defaultdict(lambda: {'total_debit': 0.0, 'total_credit': 0.0, 'nombre': 0})
-    
-    for op in operations:
-        sous_categorie = op.sous_categorie or "Non spécifié"
-        
-        if op.debit:
-            agregation[sous_categorie]['total_debit'] += op.debit
-        if op.credit:
-            agregation[sous_categorie]['total_credit'] += op.credit
-            
-        agregation[sous_categorie]['nombre'] += 1
-    
-    return dict(agregation)
+    table = _table_of(operations)
+    if table is None:
+        return _agreger_objets(operations, attrgetter("sous_categorie"), "Non spécifié")
+    return _agreger_codes(table.sous_cat_codes, table.sous_cat_labels, table.debit, table.credit)
 
-def afficher_agregation(operations):
-    """Affiche l'agrégation par catégorie"""
-    if not operations:
-        print("Aucune opération")
-        return
-        
-    agregation = agreger_par_categorie(operations)
-    
-    print("\nAGRÉGATION PAR CATÉGORIE")
-    print("=" * 80)
-    print(f"{'CATÉGORIE':<25} | {'NOMBRE':>8} | {'DÉBIT':>12} | {'CRÉDIT':>12} | {'SOLDE':>12}")
-    print("-" * 80)
+def _as_agregation(acc: dict) -> dict:
+    return {
+        key: {'total_debit': d, 'total_credit': c, 'nombre': n}
+        for key, (d, c, n) in acc.items()
+    }
+
+def agreger_par_categorie_et_sous_categorie(operations) -> Tuple[dict, dict]:
+    """Les deux agrégations simples en une seule passe sur les opérations"""
+    table = _table_of(operations)
+    cats, sous = {}, {}
+    if table is None:
+        for op in operations:
+            d = op.debit
+            if d is None:
+                d = 0.0
+            c = op.credit
+            if c is None:
+                c = 0.0
+            for acc, key in ((cats, op.categorie or "Non catégorisé"), (sous, op.sous_categorie or "Non spécifié")):
+                row = acc.get(key)
+                if row is None:
+                    row = acc[key] = [0.0, 0.0, 0]
+                row[0] += d
+                row[1] += c
+                row[2] += 1
+        return _as_agregation(cats), _as_agregation(sous)
+
+    cat_rows = [[0.0, 0.0, 0] for _ in table.cat_labels]
+    sous_rows = [[0.0, 0.0, 0] for _ in table.sous_cat_labels]
+    for ci, si, d, c in zip(table.cat_codes, table.sous_cat_codes, table.debit, table.credit):
+        row = cat_rows[ci]
+        row[0] += d
+        row[1] += c
+        row[2] += 1
+        row = sous_rows[si]
+        row[0] += d
+        row[1] += c
+        row[2] += 1
+    return (
+        _as_agregation(dict(zip(table.cat_labels, cat_rows))),
+        _as_agregation(dict(zip(table.sous_cat_labels, sous_rows))),
+    )
+
+def _render_agregation(titre: str, colonne: str, agregation: dict, nombre_total: int) -> List[str]:
+    """Construit les lignes du tableau d'une agrégation simple (catégorie ou sous-catégorie)."""
+    out = []
+    out.append(f"\n{titre}")
+    out.append("=" * 80)
+    out.append(f"{colonne:<25} | {'NOMBRE':>8} | {'DÉBIT':>12} | {'CRÉDIT':>12} | {'SOLDE':>12}")
+    out.append("-" * 80)
     
     # Tri par solde décroissant
     items = sorted(agregation.items(), key=lambda x: x[1]['total_credit'] - x[1]['total_debit'], reverse=True)
     
     total_debit = total_credit = 0
     
-    for categorie, data in items:
+    for nom, data in items:
         solde = data['total_credit'] - data['total_debit']
         
         debit_str = f"{data['total_debit']:.2f}" if data['total_debit'] > 0 else ""
         credit_str = f"{data['total_credit']:.2f}" if data['total_credit'] > 0 else ""
         solde_str = f"{solde:+.2f}"
         
-        print(f"{categorie[:24]:<25} | {data['nombre']:>8} | {debit_str:>12} | {credit_str:>12} | {solde_str:>12}")
+        out.append(f"{nom[:24]:<25} | {data['nombre']:>8} | {debit_str:>12} | {credit_str:>12} | {solde_str:>12}")
         
         total_debit += data['total_debit']
         total_credit += data['total_credit']
     
-    print("=" * 80)
+    out.append("=" * 80)
     total_solde = total_credit - total_debit
-    print(f"{'TOTAL':<25} | {len(operations):>8} | {total_debit:>12.2f} | {total_credit:>12.2f} | {total_solde:>+12.2f}")
+    out.append(f"{'TOTAL':<25} | {nombre_total:>8} | {total_debit:>12.2f} | {total_credit:>12.2f} | {total_solde:>+12.2f}")
+    return out
 
-def afficher_agregation_sous_categorie(operations):
-    """Affiche l'agrégation par sous-catégorie"""
+def afficher_agregation(operations, agregation: Optional[dict] = None):
+    """Affiche l'agrégation par catégorie (éventuellement déjà calculée)"""
     if not operations:
         print("Aucune opération")
         return
-        
-    agregation = agreger_par_sous_categorie(operations)
-    
-    print("\nAGRÉGATION PAR SOUS-CATÉGORIE")
-    print("=" * 80)
-    print(f"{'SOUS-CATÉGORIE':<25} | {'NOMBRE':>8} | {'DÉBIT':>12} | {'CRÉDIT':>12} | {'SOLDE':>12}")
-    print("-" * 80)
-    
-    # Tri par solde décroissant
-    items = sorted(agregation.items(), key=lambda x: x[1]['total_credit'] - x[1]['total_debit'], reverse=True)
-    
-    total_debit = total_credit = 0
-    
-    for sous_categorie, data in items:
-        solde = data['total_credit'] - data['total_debit']
-        
-        debit_str = f"{data['total_debit']:.2f}" if data['total_debit'] > 0 else ""
-        credit_str = f"{data['total_credit']:.2f}" if data['total_credit'] > 0 else ""
-        solde_str = f"{solde:+.2f}"
-        
-        print(f"{sous_categorie[:24]:<25} | {data['nombre']:>8} | {debit_str:>12} | {credit_str:>12} | {solde_str:>12}")
-        
-        total_debit += data['total_debit']
-        total_credit += data['total_credit']
-    
-    print("=" * 80)
-    total_solde = total_credit - total_debit
-    print(f"{'TOTAL':<25} | {len(operations):>8} | {total_debit:>12.2f} | {total_credit:>12.2f} | {total_solde:>+12.2f}")
+    if agregation is None:
+        agregation = agreger_par_categorie(operations)
+    out = _render_agregation("AGRÉGATION PAR CATÉGORIE", "CATÉGORIE", agregation, len(operations))
+    sys.stdout.write("\n".join(out) + "\n")
+
+def afficher_agregation_sous_categorie(operations, agregation: Optional[dict] = None):
+    """Affiche l'agrégation par sous-catégorie (éventuellement déjà calculée)"""
+    if not operations:
+        print("Aucune opération")
+        return
+    if agregation is None:
+        agregation = agreger_par_sous_categorie(operations)
+    out = _render_agregation("AGRÉGATION PAR SOUS-CATÉGORIE", "SOUS-CATÉGORIE", agregation, len(operations))
+    sys.stdout.write("\n".join(out) + "\n")
+
+def afficher_tout(operations):
+    """Affiche les trois vues d'agrégation en ne matérialisant les opérations qu'une fois"""
+    ops = operations if isinstance(operations, Sequence) else list(operations)
+    if not ops:
+        print("Aucune opération")
+        return
+    par_categorie, par_sous_categorie = agreger_par_categorie_et_sous_categorie(ops)
+    afficher_agregation(ops, par_categorie)
+    afficher_agregation_sous_categorie(ops, par_sous_categorie)
+    afficher_agregations_completes(ops)
 
 def afficher_agregations_completes(operations):
     """Affiche les agrégations organisées par catégorie et sous-catégorie avec totaux cohérents"""
@@ -272,166 +531,263 @@ def afficher_agregations_completes(operations):
         print("Aucune opération")
         return
     
-    # Organiser les opérations par catégorie et sous-catégorie
-    categories_data = defaultdict(lambda: {
-        'operations': [],
-        'sous_categories': defaultdict(list)
-    })
-    
-    # Regrouper les opérations
-    for op in operations:
-        categorie = op.categorie or "Non catégorisé"
-        sous_categorie = op.sous_categorie or "Non spécifié"
-        
-        categories_data[categorie]['operations'].append(op)
-        categories_data[categorie]['sous_categories'][sous_categorie].append(op)
-    
-    # Calculer les agrégations
-    def calculer_agregation(ops_list):
-        total_debit = sum(op.debit or 0.0 for op in ops_list)
-        total_credit = sum(op.credit or 0.0 for op in ops_list)
-        return {
-            'total_debit': total_debit,
-            'total_credit': total_credit,
-            'solde': total_credit - total_debit,
-            'nombre': len(ops_list)
-        }
+    table = _table_of(operations)
+    if table is None:
+        table = OperationsTable.from_operations(operations)
+    cat_labels, sous_labels = table.cat_labels, table.sous_cat_labels
+
+    # Accumulateurs indexés par le couple de codes entiers ; l'ordre d'insertion
+    # donne l'ordre de première apparition de chaque couple
+    n_sous = len(sous_labels)
+    acc = {}
+    # Totaux de catégorie cumulés ligne à ligne, comme agreger_par_categorie
+    cat_rows = [[0.0, 0.0, 0] for _ in cat_labels]
+    for ci, si, d, c in zip(table.cat_codes, table.sous_cat_codes, table.debit, table.credit):
+        row = acc.get(ci * n_sous + si)
+        if row is None:
+            row = acc[ci * n_sous + si] = [0.0, 0.0, 0]
+        row[0] += d
+        row[1] += c
+        row[2] += 1
+        row = cat_rows[ci]
+        row[0] += d
+        row[1] += c
+        row[2] += 1
+
+    par_cat = {}  # code catégorie -> [(rang, sous-catégorie, débit, crédit, nombre)]
+    for rang, (k, (debit, credit, nombre)) in enumerate(acc.items()):
+        ci, si = divmod(k, n_sous)
+        par_cat.setdefault(ci, []).append((rang, sous_labels[si], debit, credit, nombre))
+
+    cat_acc = []  # (première apparition, catégorie, [débit, crédit, nombre], sous-catégories)
+    for ci, sous in par_cat.items():
+        cat_acc.append((sous[0][0], cat_labels[ci], cat_rows[ci], sous))
     
-    print("\nAGRÉGATION PAR CATÉGORIES ET SOUS-CATÉGORIES")
-    print("=" * 90)
-    print(f"{'CATÉGORIE / SOUS-CATÉGORIE':<35} | {'NOMBRE':>8} | {'DÉBIT':>12} | {'CRÉDIT':>12} | {'SOLDE':>12}")
-    print("=" * 90)
+    out = []
+    out.append("\nAGRÉGATION PAR CATÉGORIES ET SOUS-CATÉGORIES")
+    out.append("=" * 90)
+    out.append(f"{'CATÉGORIE / SOUS-CATÉGORIE':<35} | {'NOMBRE':>8} | {'DÉBIT':>12} | {'CRÉDIT':>12} | {'SOLDE':>12}")
+    out.append("=" * 90)
     
     total_debit_global = total_credit_global = 0
     
     # Trier les catégories par solde décroissant
-    categories_avec_soldes = []
-    for categorie, data in categories_data.items():
-        agregation_cat = calculer_agregation(data['operations'])
-        categories_avec_soldes.append((categorie, agregation_cat, data))
-    
-    categories_avec_soldes.sort(key=lambda x: x[1]['solde'], reverse=True)
+    categories_triees = sorted(cat_acc, key=lambda x: x[2][1] - x[2][0], reverse=True)
     
-    for categorie, agregation_cat, data in categories_avec_soldes:
+    for _, categorie, (cat_debit, cat_credit, cat_nombre), sous in categories_triees:
         # Afficher la catégorie principale
-        debit_str = f"{agregation_cat['total_debit']:.2f}" if agregation_cat['total_debit'] > 0 else ""
-        credit_str = f"{agregation_cat['total_credit']:.2f}" if agregation_cat['total_credit'] > 0 else ""
-        solde_str = f"{agregation_cat['solde']:+.2f}"
+        debit_str = f"{cat_debit:.2f}" if cat_debit > 0 else ""
+        credit_str = f"{cat_credit:.2f}" if cat_credit > 0 else ""
+        solde_str = f"{cat_credit - cat_debit:+.2f}"
         
-        print(f"📁 {categorie[:30]:<33} | {agregation_cat['nombre']:>8} | {debit_str:>12} | {credit_str:>12} | {solde_str:>12}")
+        out.append(f"📁 {categorie[:30]:<33} | {cat_nombre:>8} | {debit_str:>12} | {credit_str:>12} | {solde_str:>12}")
         
-        # Afficher les sous-catégories
-        if len(data['sous_categories']) > 0:
-            # Trier les sous-catégories par solde
-            sous_categories_avec_soldes = []
-            for sous_cat, ops_sous in data['sous_categories'].items():
-                agregation_sous = calculer_agregation(ops_sous)
-                sous_categories_avec_soldes.append((sous_cat, agregation_sous))
+        # Afficher les sous-catégories triées par solde
+        sous_triees = sorted(sous, key=lambda x: x[3] - x[2], reverse=True)
+        for _, sous_categorie, sous_debit, sous_credit, sous_nombre in sous_triees:
+            debit_str_sous = f"{sous_debit:.2f}" if sous_debit > 0 else ""
+            credit_str_sous = f"{sous_credit:.2f}" if sous_credit > 0 else ""
+            solde_str_sous = f"{sous_credit - sous_debit:+.2f}"
             
-            sous_categories_avec_soldes.sort(key=lambda x: x[1]['solde'], reverse=True)
-            
-            for sous_categorie, agregation_sous in sous_categories_avec_soldes:
-                debit_str_sous = f"{agregation_sous['total_debit']:.2f}" if agregation_sous['total_debit'] > 0 else ""
-                credit_str_sous = f"{agregation_sous['total_credit']:.2f}" if agregation_sous['total_credit'] > 0 else ""
-                solde_str_sous = f"{agregation_sous['solde']:+.2f}"
-                
-                print(f"  ├─ {sous_categorie[:28]:<31} | {agregation_sous['nombre']:>8} | {debit_str_sous:>12} | {credit_str_sous:>12} | {solde_str_sous:>12}")
+            out.append(f"  ├─ {sous_categorie[:28]:<31} | {sous_nombre:>8} | {debit_str_sous:>12} | {credit_str_sous:>12} | {solde_str_sous:>12}")
         
-        print("-" * 90)
+        out.append("-" * 90)
         
-        total_debit_global += agregation_cat['total_debit']
-        total_credit_global += agregation_cat['total_credit']
+        total_debit_global += cat_debit
+        total_credit_global += cat_credit
     
-    print("=" * 90)
+    out.append("=" * 90)
     total_solde_global = total_credit_global - total_debit_global
-    print(f"{'TOTAL GÉNÉRAL':<35} | {len(operations):>8} | {total_debit_global:>12.2f} | {total_credit_global:>12.2f} | {total_solde_global:>+12.2f}")
+    out.append(f"{'TOTAL GÉNÉRAL':<35} | {len(operations):>8} | {total_debit_global:>12.2f} | {total_credit_global:>12.2f} | {total_solde_global:>+12.2f}")
     
     # Statistiques
-    nb_categories = len(categories_data)
-    nb_sous_categories = sum(len(data['sous_categories']) for data in categories_data.values())
-    print(f"\n📊 {nb_categories} catégories, {nb_sous_categories} sous-catégories")
+    nb_categories = len(cat_acc)
+    nb_sous_categories = sum(len(sous) for _, _, _, sous in cat_acc)
+    out.append(f"\n📊 {nb_categories} catégories, {nb_sous_categories} sous-catégories")
+    sys.stdout.write("\n".join(out) + "\n")
 
 # ---------------------- I/O ----------------------
 
-def import_operations_from_csv(path: str) -> List[OperationBancaire]:
-    operations: List[OperationBancaire] = []
+# Lectures de 1 Mio : quelques gros appels read() au lieu de blocs de 8 Kio
+_READ_BUFFER_SIZE = 1 << 20
+
+def _resolve_columns(reader) -> Tuple[List[str], dict, int]:
+    """Lit l'en-tête et renvoie (en-têtes d'origine, position de chaque champ interne, largeur)."""
+    original_headers = next(reader, None)
+    if not original_headers:
+        raise ValueError("Aucune colonne détectée (vérifie le fichier).")
+    norm_headers = [normalize_header(h) for h in original_headers]
+    field_map = map_headers_to_fields(tuple(norm_headers))
+    # En cas de doublon, la dernière colonne l'emporte (comme avec DictReader)
+    header_index = {h: i for i, h in enumerate(norm_headers)}
+    field_index = {internal: header_index[key] for internal, key in field_map.items()}
+    return original_headers, field_index, len(norm_headers)
+
+def _read_raw_columns(path: str) -> Tuple[dict, int]:
+    """Lit le CSV et regroupe les valeurs brutes par champ interne (une liste par colonne)."""
+    dialect = detect_dialect(path)
+    with open(path, "r", encoding="utf-8", errors="replace", newline="", buffering=_READ_BUFFER_SIZE) as f:
+        reader = csv.reader(f, dialect=dialect)
+        _, field_index, width = _resolve_columns(reader)
+        columns = {internal: [] for internal in field_index}
+        appenders = [(columns[internal].append, i) for internal, i in field_index.items()]
+        n_rows = 0
+        # Lignes complétées à la largeur de l'en-tête : le corps ne peut pas lever ;
+        # les erreurs du lecteur CSV remontent telles quelles.
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            for append, i in appenders:
+                append(row[i].strip())
+            n_rows += 1
+
+    return columns, n_rows
+
+def _parse_columns(columns: dict, n_rows: int) -> dict:
+    """Convertit les colonnes brutes en colonnes typées, une colonne à la fois."""
+    # Une liste distincte par colonne absente : les colonnes peuvent ensuite être étendues
+    col = lambda field: columns[field] if field in columns else [""] * n_rows
+
+    # Colonnes entières converties par map() : la boucle par cellule reste en C
+    debits = list(map(parse_amount, col("debit")))
+    credits = list(map(parse_amount, col("credit")))
+    if "montant" in columns:
+        for i, montant_raw in enumerate(columns["montant"]):
+            if debits[i] is None and credits[i] is None and montant_raw:
+                m = parse_amount(montant_raw)
+                if m is not None:
+                    if m < 0:
+                        debits[i] = abs(m)
+                    elif m > 0:
+                        credits[i] = m
+                    else:
+                        debits[i] = credits[i] = 0.0
+
+    lib_op = col("libelle_operation")
+    return {
+        "date_comptabilisation": list(map(parse_date, col("date_comptabilisation"))),
+        "libelle_simplifie": [simpl or op for simpl, op in zip(col("libelle_simplifie"), lib_op)],
+        "libelle_operation": lib_op,
+        "reference": col("reference"),
+        "informations_complementaires": col("informations_complementaires"),
+        # Colonnes à faible cardinalité : une seule instance par valeur distincte
+        "type_operation": list(map(sys.intern, col("type_operation"))),
+        "categorie": list(map(sys.intern, col("categorie"))),
+        "sous_categorie": list(map(sys.intern, col("sous_categorie"))),
+        "debit": debits,
+        "credit": credits,
+    }
+
+def import_operations_from_csv(path: str) -> OperationsView:
+    return OperationsView(_parse_columns(*_read_raw_columns(path)))
+
+def stream_operations_from_csv(path: str) -> Iterator[tuple]:
+    """Produit les opérations ligne à ligne, sous forme de tuples dans l'ordre de _FIELDS."""
     dialect = detect_dialect(path)
-    with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
-        reader = csv.DictReader(f, dialect=dialect)
-        if not reader.fieldnames:
-            raise ValueError("Aucune colonne détectée (vérifie le fichier).")
-        original_headers = reader.fieldnames[:]
-        norm_headers = [normalize_header(h) for h in original_headers]
-        field_map = map_headers_to_fields(norm_headers)
-
-        for idx, raw_row in enumerate(reader, start=2):  # start=2 accounts for header line
+    with open(path, "r", encoding="utf-8", errors="replace", newline="", buffering=_READ_BUFFER_SIZE) as f:
+        reader = csv.reader(f, dialect=dialect)
+        original_headers, field_index, width = _resolve_columns(reader)
+        indices = [field_index.get(field) for field in _FIELDS + ("montant",)]
+        # Globales résolues une fois, pas à chaque ligne
+        _parse_amount, _parse_date, _intern = parse_amount, parse_date, sys.intern
+        for row in reader:
+            if not row:
+                continue
             try:
-                row_norm = {normalize_header(k): (v or "").strip() for k, v in raw_row.items()}
-                date_val = row_norm.get(field_map.get("date_comptabilisation", ""), "")
-                lib_simpl = row_norm.get(field_map.get("libelle_simplifie", ""), "")
-                lib_op = row_norm.get(field_map.get("libelle_operation", ""), "")
-                ref = row_norm.get(field_map.get("reference", ""), "")
-                infos = row_norm.get(field_map.get("informations_complementaires", ""), "")
-                typ = row_norm.get(field_map.get("type_operation", ""), "")
-                cat = row_norm.get(field_map.get("categorie", ""), "")
-                scat = row_norm.get(field_map.get("sous_categorie", ""), "")
-                debit_raw = row_norm.get(field_map.get("debit", ""), "")
-                credit_raw = row_norm.get(field_map.get("credit", ""), "")
-                montant_raw = row_norm.get(field_map.get("montant", ""), "")
-
-                date_iso = parse_date(date_val)
-                debit_val = parse_amount(debit_raw) if debit_raw else None
-                credit_val = parse_amount(credit_raw) if credit_raw else None
-
-                if (debit_val is None and credit_val is None) and montant_raw:
-                    m = parse_amount(montant_raw)
+                if len(row) < width:
+                    row += [""] * (width - len(row))
+                (date, simpl, lib_op, ref, info, type_op, cat, scat,
+                 debit_raw, credit_raw, montant_raw) = [row[i].strip() if i is not None else "" for i in indices]
+                debit = _parse_amount(debit_raw) if debit_raw else None
+                credit = _parse_amount(credit_raw) if credit_raw else None
+                if debit is None and credit is None and montant_raw:
+                    m = _parse_amount(montant_raw)
                     if m is not None:
                         if m < 0:
-                            debit_val = abs(m); credit_val = None
+                            debit = abs(m)
                         elif m > 0:
-                            credit_val = m; debit_val = None
+                            credit = m
                         else:
-                            debit_val = credit_val = 0.0
-
-                libelle_simpl = lib_simpl or lib_op
-
-                op = OperationBancaire(
-                    date_comptabilisation=date_iso,
-                    libelle_simplifie=libelle_simpl,
-                    libelle_operation=lib_op,
-                    reference=ref,
-                    informations_complementaires=infos,
-                    type_operation=typ,
-                    categorie=cat,
-                    sous_categorie=scat,
-                    debit=debit_val,
-                    credit=credit_val,
-                )
-                operations.append(op)
-
+                            debit = credit = 0.0
+                op = (_parse_date(date), simpl or lib_op, lib_op, ref, info,
+                      _intern(type_op), _intern(cat), _intern(scat), debit, credit)
             except Exception as e:
-                preview = {k: (v if v is not None else "") for k, v in (raw_row or {}).items()}
-                raise RuntimeError(f"Erreur à la ligne {idx}: {e}\n  Aperçu: {preview}") from e
+                preview = dict(zip(original_headers, row))
+                raise RuntimeError(f"Erreur à la ligne {reader.line_num}: {e}\n  Aperçu: {preview}") from e
+            yield op
+
+def iter_operations_from_csv(path: str) -> Iterator[OperationBancaire]:
+    """Produit les OperationBancaire une à une, sans liste intermédiaire."""
+    return starmap(OperationBancaire, stream_operations_from_csv(path))
+
+def _grow(buf: array) -> None:
+    """Double la capacité d'un tampon préalloué (complété par des zéros)."""
+    buf.frombytes(bytes(buf.itemsize * len(buf)))
 
-    return operations
+def load_table(path: str, chunk: int = 65536) -> OperationsTable:
+    """Charge directement les colonnes d'agrégation, sans matérialiser les opérations."""
+    debit = array("d", [0.0]) * chunk
+    credit = array("d", [0.0]) * chunk
+    cat_codes = array("l", [0]) * chunk
+    sous_codes = array("l", [0]) * chunk
+    cat_index: dict = {}
+    sous_index: dict = {}
+    n = 0
+    for op in stream_operations_from_csv(path):
+        if n == len(debit):
+            for buf in (debit, credit, cat_codes, sous_codes):
+                _grow(buf)
+        d, c = op[8], op[9]
+        debit[n] = 0.0 if d is None else d
+        credit[n] = 0.0 if c is None else c
+        cat = op[6] or "Non catégorisé"
+        scat = op[7] or "Non spécifié"
+        cat_codes[n] = cat_index.setdefault(cat, len(cat_index))
+        sous_codes[n] = sous_index.setdefault(scat, len(sous_index))
+        n += 1
+    for buf in (debit, credit, cat_codes, sous_codes):
+        del buf[n:]
+    return OperationsTable(
+        debit=debit,
+        credit=credit,
+        cat_codes=cat_codes,
+        cat_labels=list(cat_index),
+        sous_cat_codes=sous_codes,
+        sous_cat_labels=list(sous_index),
+    )
+
+def _fmt_export(v: Optional[float]) -> str:
+    return "" if v is None else f"{v:.2f}"
+
+def aggregate_from_csv(path: str) -> Tuple[dict, dict]:
+    """Agrégations par catégorie et sous-catégorie lues au fil du fichier (seules les colonnes numériques restent en mémoire)."""
+    return agreger_par_categorie_et_sous_categorie(load_table(path))
+
+# Écritures de 1 Mio : l'export ne déclenche qu'un write() par mégaoctet
+_WRITE_BUFFER_SIZE = 1 << 20
 
 def export_operations_to_csv(operations: List[OperationBancaire], path: str):
-    fieldnames = [
-        "date_comptabilisation", "libelle_simplifie", "libelle_operation",
-        "reference", "informations_complementaires", "type_operation",
-        "categorie", "sous_categorie", "debit", "credit"
-    ]
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for op in operations:
-            writer.writerow(op.to_dict_export())
+    # Lignes positionnelles : ni dict par opération, ni instanciation depuis une vue en colonnes
+    if isinstance(operations, OperationsView):
+        rows = zip(*operations._columns)
+    else:
+        rows = map(attrgetter(*_FIELDS), operations)
+    with open(path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(_FIELDS)
+        writer.writerows(r[:8] + (_fmt_export(r[8]), _fmt_export(r[9])) for r in rows)
 
 # ---------------------- CLI ----------------------
 
+# Nombre de lignes de tableau regroupées par écriture sur stdout
+_DISPLAY_CHUNK = 4096
+
 class MenuImport:
     def __init__(self):
-        self.operations: List[OperationBancaire] = []
+        # Stockage en colonnes : les totaux et agrégations lisent directement la table SoA
+        self.operations = OperationsView.empty()
 
     def afficher_menu(self):
         print("\n" + "="*64)
@@ -448,17 +804,26 @@ class MenuImport:
 
     def lister_fichiers_csv(self):
         print("\n🔍 Fichiers CSV trouvés:")
-        fichiers = [f for f in os.listdir(".") if f.lower().endswith(".csv")]
-        if fichiers:
-            for i, f in enumerate(fichiers, 1):
+        # scandir : nom, type et taille issus de l'énumération, sans stat() séparé par fichier
+        entrees = []
+        with os.scandir(".") as it:
+            for e in it:
+                if not e.name.lower().endswith(".csv"):
+                    continue
                 try:
-                    taille = os.path.getsize(f)
-                except Exception:
+                    if not e.is_file():
+                        continue
+                    taille = e.stat().st_size
+                except OSError:
                     taille = 0
+                entrees.append((e.name, taille))
+        entrees.sort(key=lambda e: e[0].lower())
+        if entrees:
+            for i, (f, taille) in enumerate(entrees, 1):
                 print(f"  {i}. {f} ({taille} octets)")
         else:
             print("  Aucun fichier CSV trouvé dans le répertoire courant")
-        return fichiers
+        return [f for f, _ in entrees]
 
     def importer_fichier(self):
         print("\n📥 IMPORT DE FICHIER")
@@ -496,8 +861,9 @@ class MenuImport:
         input("\nAppuyez sur Entrée pour continuer...")
 
     def _totaux(self) -> Tuple[float, float, float]:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
+        table = self.operations.table
+        debit = sum(table.debit)
+        credit = sum(table.credit)
         solde = credit - debit
         return debit, credit, solde
 
@@ -514,6 +880,10 @@ class MenuImport:
             print("\n" + "="*110)
             print(f"{'DATE':<12} | {'LIBELLÉ':<36} | {'CATÉGORIE':<18} | {'DÉBIT':>12} | {'CRÉDIT':>12}")
             print("-"*110)
+            # Lignes accumulées puis écrites par paquets : un write() pour _DISPLAY_CHUNK lignes
+            write = sys.stdout.writelines
+            lines = []
+            append = lines.append
             for op in self.operations:
                 date_str = (op.date_comptabilisation or "")[:10]
                 lib = op.libelle_simplifie or op.libelle_operation or ""
@@ -522,7 +892,11 @@ class MenuImport:
                 cat = (cat[:15] + "...") if len(cat) > 18 else cat
                 deb = f"{op.debit:,.2f}".replace(",", " ").replace(".", ",") if op.debit is not None else ""
                 cre = f"{op.credit:,.2f}".replace(",", " ").replace(".", ",") if op.credit is not None else ""
-                print(f"{date_str:<12} | {lib:<36} | {cat:<18} | {deb:>12} | {cre:>12}")
+                append(f"{date_str:<12} | {lib:<36} | {cat:<18} | {deb:>12} | {cre:>12}\n")
+                if len(lines) >= _DISPLAY_CHUNK:
+                    write(lines)
+                    lines.clear()
+            write(lines)
             print("="*110)
             d, c, s = self._totaux()
             fmt = lambda x: f"{x:,.2f}".replace(",", " ").replace(".", ",")
@@ -639,14 +1013,68 @@ def run_batch(input_path: str, output_path: str):
     export_operations_to_csv(ops, output_path)
     print(f"✅ Import '{input_path}' -> Export '{output_path}' ({len(ops)} opérations)")
 
+def run_aggregate(input_path: str):
+    """Affiche l'agrégation complète d'un fichier sans matérialiser les opérations."""
+    afficher_agregations_completes(load_table(input_path))
+
+def _import_export(input_path: str, output_path: str) -> int:
+    """Tâche d'un processus de run_batch_many : seul le nombre d'opérations revient au parent."""
+    ops = import_operations_from_csv(input_path)
+    export_operations_to_csv(ops, output_path)
+    return len(ops)
+
+def run_batch_many(input_paths: List[str], out_dir: str, max_workers: Optional[int] = None):
+    """Traite plusieurs fichiers en parallèle, un processus par fichier (out_dir/<nom du fichier>)."""
+    output_paths = [os.path.join(out_dir, os.path.basename(p)) for p in input_paths]
+    if len(set(output_paths)) != len(output_paths):
+        raise ValueError("Plusieurs fichiers en entrée portent le même nom.")
+    # out_dir peut être le dossier d'une entrée : l'export l'écraserait avant sa lecture
+    entrees = {os.path.normcase(os.path.realpath(p)) for p in input_paths}
+    ecrasees = [o for o in output_paths if os.path.normcase(os.path.realpath(o)) in entrees]
+    if ecrasees:
+        raise ValueError(f"La sortie écraserait un fichier en entrée: {', '.join(ecrasees)}")
+    os.makedirs(out_dir, exist_ok=True)
+    workers = min(len(input_paths), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        counts = list(pool.map(_import_export, input_paths, output_paths))
+    for input_path, output_path, n in zip(input_paths, output_paths, counts):
+        print(f"✅ Import '{input_path}' -> Export '{output_path}' ({n} opérations)")
+    print(f"📊 {len(input_paths)} fichiers, {sum(counts)} opérations")
+
 # ---------------------- Entry ----------------------
 
 def main():
     parser = argparse.ArgumentParser(description="Import/clean bank CSVs.")
     parser.add_argument("--in", dest="input_path", help="Chemin du fichier CSV en entrée")
     parser.add_argument("--out", dest="output_path", help="Chemin du CSV nettoyé en sortie")
+    parser.add_argument("--in-many", dest="input_paths", nargs="+", help="Plusieurs CSV traités en parallèle")
+    parser.add_argument("--out-dir", dest="out_dir", help="Dossier de sortie pour --in-many")
+    parser.add_argument("--aggregate", action="store_true", help="Avec --in : affiche l'agrégation sans export")
     args = parser.parse_args()
 
+    if args.input_path and args.aggregate:
+        if not os.path.exists(args.input_path):
+            print(f"⚠️ Fichier introuvable: {args.input_path}")
+            sys.exit(1)
+        try:
+            run_aggregate(args.input_path)
+        except Exception as e:
+            print(f"⚠️ Erreur: {e}")
+            sys.exit(2)
+        sys.exit(0)
+
+    if args.input_paths and args.out_dir:
+        manquants = [p for p in args.input_paths if not os.path.exists(p)]
+        if manquants:
+            print(f"⚠️ Fichier introuvable: {', '.join(manquants)}")
+            sys.exit(1)
+        try:
+            run_batch_many(args.input_paths, args.out_dir)
+        except Exception as e:
+            print(f"⚠️ Erreur: {e}")
+            sys.exit(2)
+        sys.exit(0)
+
     if args.input_path and args.output_path:
         if not os.path.exists(args.input_path):
             print(f"⚠️ Fichier introuvable: {args.input_path}")
@@ -8,6 +8,7 @@ Usage (interactive menu):
 
 Usage (batch import + export):
     python main_fixed.py --in input.csv --out cleaned.csv
+    python main_fixed.py --merge jan.csv feb.csv mar.csv --out cleaned.csv
 
 Key features:
 - Auto-detect delimiter (",", ";", "|", TAB) with safe fallback.
@@ -22,108 +23,64 @@ Key features:
 import argparse
 import csv
 import os
-import re
+import shutil
 import sys
-from dataclasses import asdict
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
 from datetime import datetime
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # --- Import des fonctions utilitaires ---
 from utils import strip_accents, normalize_header, detect_dialect
 
-_DATE_FORMATS = [
-    "%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y", "%d.%m.%Y",
-    "%d %m %Y", "%d %b %Y", "%d %B %Y", "%Y/%m/%d",
-]
-
-def parse_date(s: str) -> str:
-    s = (s or "").strip()
-    if not s:
-        return ""
-    for fmt in _DATE_FORMATS:
-        try:
-            return datetime.strptime(s, fmt).date().isoformat()
-        except Exception:
-            pass
-    s2 = re.sub(r"[ T].*$", "", s)
-    for fmt in _DATE_FORMATS:
-        try:
-            return datetime.strptime(s2, fmt).date().isoformat()
-        except Exception:
-            pass
-    try:
-        return datetime.fromisoformat(s2).date().isoformat()
-    except Exception:
-        return s  # keep raw if unknown
-
-_AMOUNT_SEP_RE = re.compile(r"[ \u00A0]")
-
-def parse_amount(raw: str) -> Optional[float]:
-    if raw is None:
-        return None
-    s = str(raw).strip()
-    if not s:
-        return None
-    negative = False
-    if s.startswith("(") and s.endswith(")"):
-        negative = True
-        s = s[1:-1]
-    s = _AMOUNT_SEP_RE.sub("", s)
-    if "," in s and s.count(",") == 1 and s.count(".") == 0:
-        s = s.replace(",", ".")
-    if "," in s and "." in s and s.rfind(",") > s.rfind("."):
-        s = s.replace(".", "")
-        s = s.replace(",", ".")
-    s = re.sub(r"[^\d\.\-+]", "", s)
-    if s in ("", "-", "+"):
-        return None
-    try:
-        val = float(s)
-        return -abs(val) if negative else val
-    except ValueError:
-        return None
-
 # ---------------------- Model ----------------------
 
 # --- Import de la dataclass ---
 from models import OperationBancaire
 
-# Header aliases
-HEADER_ALIASES = {
-    "date_comptabilisation": {"date_comptabilisation", "date", "date_operation", "date_valeur", "date_de_comptabilisation"},
-    "libelle_simplifie": {"libelle_simplifie", "libelle_simplifiee", "libelle", "intitule", "description"},
-    "libelle_operation": {"libelle_operation", "details", "intitule_complet"},
-    "reference": {"reference", "ref", "id_operation", "numero_operation"},
-    "informations_complementaires": {"informations_complementaires", "infos", "information", "note", "memo"},
-    "type_operation": {"type_operation", "type", "mode", "categorie_banque"},
-    "categorie": {"categorie", "category"},
-    "sous_categorie": {"sous_categorie", "sous_categ", "subcategory"},
-    "debit": {"debit", "montant_debit", "sortie", "amount_out", "montant_negatif"},
-    "credit": {"credit", "montant_credit", "entree", "amount_in", "montant_positif"},
-    "montant": {"montant", "amount", "valeur"},
-}
-
-def map_headers_to_fields(norm_headers: List[str]) -> dict:
-    set_headers = set(norm_headers)
-    mapping = {}
-    for internal, aliases in HEADER_ALIASES.items():
-        for alias in aliases:
-            n = normalize_header(alias)
-            if n in set_headers:
-                mapping[internal] = n
-                break
-    return mapping
+_FIELDS = tuple(f.name for f in fields(OperationBancaire))
 
 # ---------------------- I/O ----------------------
 
 # --- Import des fonctions d'I/O CSV ---
-from csv_handler import import_operations_from_csv, export_operations_to_csv
+from csv_handler import (
+    import_columns_from_csv, import_columns_from_csv_parallel,
+    iter_operations_from_csv, export_operations_to_csv,
+)
+# Parseurs de cellules : ceux de csv_handler, qui fait toute la lecture des CSV
+from csv_handler import parse_amount, parse_date
+from csv_handler import HEADER_ALIASES, map_headers_to_fields
 
 # ---------------------- CLI ----------------------
 
+# Touches de navigation du détail paginé
+_NAV = {"s": "suivant", "p": "precedent", "q": "quitter"}
+
+# Nombre de lignes de tableau regroupées par écriture sur stdout
+_DISPLAY_CHUNK = 4096
+
+@lru_cache(maxsize=4096)
+def _format_float_cached(x: float) -> str:
+    return f"{x:,.2f}".replace(",", " ").replace(".", ",")
+
+def _format_float(x: float) -> str:
+    """Montant au format français (1 234,56) ; les montants récurrents sont servis par le cache."""
+    # 0.0 et -0.0 partagent la même clé de cache mais ne s'affichent pas pareil
+    if not x:
+        return f"{x:.2f}".replace(".", ",")
+    return _format_float_cached(x)
+
 class MenuImport:
     def __init__(self):
-        self.operations: List[OperationBancaire] = []
+        # Opérations en colonnes (champ -> liste) ; une OperationBancaire n'est créée qu'à l'affichage
+        self.cols: Dict[str, list] = {field: [] for field in _FIELDS}
+        # Montants en colonnes (None -> 0.0), tenus à jour à l'import et au vidage
+        self._debits = array("d")
+        self._credits = array("d")
+        # Pages du détail déjà rendues (numéro -> texte), invalidées à chaque modification
+        self._page_cache: Dict[int, str] = {}
 
     def afficher_menu(self):
         print("\n" + "="*64)
@@ -139,17 +96,26 @@ class MenuImport:
 
     def lister_fichiers_csv(self):
         print("\n📁 Fichiers CSV trouvés:")
-        fichiers = [f for f in os.listdir(".") if f.lower().endswith(".csv")]
-        if fichiers:
-            for i, f in enumerate(fichiers, 1):
+        # scandir : nom, type et taille issus de l'énumération, sans stat() séparé par fichier
+        entrees = []
+        with os.scandir(".") as it:
+            for e in it:
+                if not e.name.lower().endswith(".csv"):
+                    continue
                 try:
-                    taille = os.path.getsize(f)
-                except Exception:
+                    if not e.is_file():
+                        continue
+                    taille = e.stat().st_size
+                except OSError:
                     taille = 0
+                entrees.append((e.name, taille))
+        entrees.sort(key=lambda e: e[0].lower())
+        if entrees:
+            for i, (f, taille) in enumerate(entrees, 1):
                 print(f"  {i}. {f} ({taille} octets)")
         else:
             print("  Aucun fichier CSV trouvé dans le répertoire courant")
-        return fichiers
+        return [f for f, _ in entrees]
 
     def importer_fichier(self):
         print("\n📥 IMPORT DE FICHIER")
@@ -174,26 +140,50 @@ class MenuImport:
             print(f"❌ Fichier '{nom}' introuvable"); input("\nAppuyez sur Entrée pour continuer..."); return
 
         try:
-            nouvelles = import_operations_from_csv(nom)
+            nouvelles = import_columns_from_csv_parallel(nom)
         except Exception as e:
             print(str(e)); input("\nAppuyez sur Entrée pour continuer..."); return
 
-        if nouvelles:
-            self.operations.extend(nouvelles)
-            print(f"📊 Total en mémoire: {len(self.operations)} opérations")
+        if nouvelles["debit"]:
+            self._ajouter(nouvelles)
+            print(f"📊 Total en mémoire: {len(self)} opérations")
         else:
             print("ℹ️ Aucune opération importée")
 
         input("\nAppuyez sur Entrée pour continuer...")
 
+    def __len__(self) -> int:
+        return len(self.cols["debit"])
+
+    def _op(self, i: int) -> OperationBancaire:
+        cols = self.cols
+        return OperationBancaire(*(cols[field][i] for field in _FIELDS))
+
+    def _iter_operations(self) -> Iterator[OperationBancaire]:
+        return map(OperationBancaire, *(self.cols[field] for field in _FIELDS))
+
+    def _ajouter(self, nouvelles: Dict[str, list]):
+        for field in _FIELDS:
+            self.cols[field].extend(nouvelles[field])
+        self._debits.extend([0.0 if d is None else d for d in nouvelles["debit"]])
+        self._credits.extend([0.0 if c is None else c for c in nouvelles["credit"]])
+        self._page_cache.clear()
+
+    def _vider(self):
+        for col in self.cols.values():
+            col.clear()
+        del self._debits[:]
+        del self._credits[:]
+        self._page_cache.clear()
+
     def _totaux(self) -> Tuple[float, float, float]:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
+        debit = sum(self._debits)
+        credit = sum(self._credits)
         solde = credit - debit
         return debit, credit, solde
 
     def afficher_operations(self):
-        n = len(self.operations)
+        n = len(self)
         print(f"\n📋 OPÉRATIONS CHARGÉES ({n})")
         if n == 0:
             print("Aucune opération en mémoire")
@@ -205,18 +195,30 @@ class MenuImport:
             print("\n" + "="*110)
             print(f"{'DATE':<12} | {'LIBELLÉ':<36} | {'CATÉGORIE':<18} | {'DÉBIT':>12} | {'CRÉDIT':>12}")
             print("-"*110)
-            for op in self.operations:
-                date_str = (op.date_comptabilisation or "")[:10]
-                lib = op.libelle_simplifie or op.libelle_operation or ""
+            # Lignes accumulées puis écrites par paquets de _DISPLAY_CHUNK
+            write = sys.stdout.writelines
+            lines = []
+            append = lines.append
+            cols = self.cols
+            for date, simpl, lib_op, cat, debit, credit in zip(
+                cols["date_comptabilisation"], cols["libelle_simplifie"], cols["libelle_operation"],
+                cols["categorie"], cols["debit"], cols["credit"],
+            ):
+                date_str = (date or "")[:10]
+                lib = simpl or lib_op or ""
                 lib = (lib[:33] + "...") if len(lib) > 36 else lib
-                cat = op.categorie or ""
+                cat = cat or ""
                 cat = (cat[:15] + "...") if len(cat) > 18 else cat
-                deb = f"{op.debit:,.2f}".replace(",", " ").replace(".", ",") if op.debit is not None else ""
-                cre = f"{op.credit:,.2f}".replace(",", " ").replace(".", ",") if op.credit is not None else ""
-                print(f"{date_str:<12} | {lib:<36} | {cat:<18} | {deb:>12} | {cre:>12}")
+                deb = _format_float(debit) if debit is not None else ""
+                cre = _format_float(credit) if credit is not None else ""
+                append(f"{date_str:<12} | {lib:<36} | {cat:<18} | {deb:>12} | {cre:>12}\n")
+                if len(lines) >= _DISPLAY_CHUNK:
+                    write(lines)
+                    lines.clear()
+            write(lines)
             print("="*110)
             d, c, s = self._totaux()
-            fmt = lambda x: f"{x:,.2f}".replace(",", " ").replace(".", ",")
+            fmt = _format_float
             print(f"Totaux  Débit={fmt(d)} | Crédit={fmt(c)} | Solde={fmt(s)}")
 
         elif choix == "3":
@@ -225,71 +227,79 @@ class MenuImport:
             while True:
                 start = page * per_page
                 end = min(start + per_page, n)
-                print(f"\n📄 Page {page+1} — Opérations {start+1} à {end}/{n}")
-                print("-"*80)
-                for i in range(start, end):
-                    op = self.operations[i]
-                    print(f"\n🔹 #{i+1}")
-                    print(f"   Date        : {op.date_comptabilisation}")
-                    print(f"   Libellé     : {op.libelle_simplifie or op.libelle_operation}")
-                    print(f"   Catégorie   : {op.categorie} / {op.sous_categorie}")
-                    print(f"   Montant     : Débit={op.debit} | Crédit={op.credit}")
-                    print(f"   Type        : {op.type_operation}")
-                    print(f"   Référence   : {op.reference}")
-                    if op.informations_complementaires:
-                        print(f"   Informations: {op.informations_complementaires}")
+                # Une page = une seule écriture, rendue une fois tant que les opérations ne changent pas
+                texte = self._page_cache.get(page)
+                if texte is None:
+                    lines = [f"\n📄 Page {page+1} — Opérations {start+1} à {end}/{n}", "-"*80]
+                    for i in range(start, end):
+                        op = self._op(i)
+                        lines.append(f"\n🔹 #{i+1}")
+                        lines.append(f"   Date        : {op.date_comptabilisation}")
+                        lines.append(f"   Libellé     : {op.libelle_simplifie or op.libelle_operation}")
+                        lines.append(f"   Catégorie   : {op.categorie} / {op.sous_categorie}")
+                        lines.append(f"   Montant     : Débit={op.debit} | Crédit={op.credit}")
+                        lines.append(f"   Type        : {op.type_operation}")
+                        lines.append(f"   Référence   : {op.reference}")
+                        if op.informations_complementaires:
+                            lines.append(f"   Informations: {op.informations_complementaires}")
+                    texte = self._page_cache[page] = "\n".join(lines) + "\n"
+                sys.stdout.write(texte)
 
                 if end >= n and start == 0:
                     break
                 nav = input("\n(s)uivant | (p)récédent | (q)uitter | (numéro de page): ").strip().lower()
-                if nav == "s" and end < n:
-                    page += 1
-                elif nav == "p" and page > 0:
-                    page -= 1
-                elif nav == "q":
+                action = _NAV.get(nav)
+                if action == "suivant":
+                    if end < n:
+                        page += 1
+                elif action == "precedent":
+                    if page > 0:
+                        page -= 1
+                elif action == "quitter":
                     break
                 elif nav.isdigit():
                     newp = int(nav) - 1
                     if 0 <= newp <= (n - 1) // per_page:
                         page = newp
         else:
-            print("-"*80)
-            for i, op in enumerate(self.operations[:10], 1):
-                print(f"{i:2d}. {op.date_comptabilisation or 'N/A'} - {(op.libelle_simplifie or op.libelle_operation or '—')[:60]} "
-                      f"- Débit: {op.debit if op.debit is not None else ''} - Crédit: {op.credit if op.credit is not None else ''}")
+            lines = ["-"*80]
+            for i, op in enumerate(map(self._op, range(min(n, 10))), 1):
+                lines.append(f"{i:2d}. {op.date_comptabilisation or 'N/A'} - {(op.libelle_simplifie or op.libelle_operation or '—')[:60]} "
+                             f"- Débit: {op.debit if op.debit is not None else ''} - Crédit: {op.credit if op.credit is not None else ''}")
             if n > 10:
-                print(f"... et {n - 10} autres opérations")
+                lines.append(f"... et {n - 10} autres opérations")
+            sys.stdout.write("\n".join(lines) + "\n")
             d, c, s = self._totaux()
-            fmt = lambda x: f"{x:,.2f}".replace(",", " ").replace(".", ",")
+            fmt = _format_float
             print("-"*80)
             print(f"Totaux  Débit={fmt(d)} | Crédit={fmt(c)} | Solde={fmt(s)}")
 
         input("\nAppuyez sur Entrée pour continuer...")
 
     def exporter_operations(self):
-        if not self.operations:
+        if len(self) == 0:
             print("\n❌ Aucune opération à exporter")
             input("Appuyez sur Entrée pour continuer..."); return
 
-        print(f"\n📤 EXPORT ({len(self.operations)} opérations)")
+        print(f"\n📤 EXPORT ({len(self)} opérations)")
         nom = input("Nom du fichier de sortie (sans .csv): ").strip()
         if not nom:
             nom = f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         path = nom + ".csv"
         try:
-            export_operations_to_csv(self.operations, path)
+            export_operations_to_csv(self._iter_operations(), path)
             print(f"✅ Export réussi vers {path}")
         except Exception as e:
             print(f"❌ Erreur lors de l'export: {e}")
         input("\nAppuyez sur Entrée pour continuer...")
 
     def vider_operations(self):
-        if not self.operations:
+        if len(self) == 0:
             print("\n💡 Aucune opération en mémoire")
             input("Appuyez sur Entrée pour continuer..."); return
-        confirmation = input(f"\n⚠️  Vider les {len(self.operations)} opérations en mémoire ? (oui/non): ").strip().lower()
+        confirmation = input(f"\n⚠️  Vider les {len(self)} opérations en mémoire ? (oui/non): ").strip().lower()
         if confirmation in {"oui", "o", "yes", "y"}:
-            self.operations.clear()
+            self._vider()
             print("✅ Opérations supprimées")
         else:
             print("❌ Annulé")
@@ -315,10 +325,47 @@ class MenuImport:
             else:
                 print("\n❌ Choix invalide"); input("Appuyez sur Entrée pour continuer...")
 
+def _export_replacing(operations, output_path: str) -> int:
+    """Exporte dans un fichier temporaire voisin, qui ne remplace output_path qu'une fois complet.
+
+    En cas d'erreur (lecture ou écriture), seul le temporaire est supprimé : un fichier
+    de sortie déjà présent reste intact.
+    """
+    directory, name = os.path.split(os.path.abspath(output_path))
+    tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+    try:
+        n = export_operations_to_csv(operations, tmp_path)
+        if os.path.exists(output_path):
+            shutil.copymode(output_path, tmp_path)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return n
+
 def run_batch(input_path: str, output_path: str):
-    ops = import_operations_from_csv(input_path)
-    export_operations_to_csv(ops, output_path)
-    print(f"✅ Import '{input_path}' -> Export '{output_path}' ({len(ops)} opérations)")
+    if os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+        # Nettoyage sur place : tout lire avant de réécrire le même fichier
+        operations = list(iter_operations_from_csv(input_path))
+    else:
+        # Lecture et écriture en flux : aucune liste d'opérations en mémoire
+        operations = iter_operations_from_csv(input_path)
+    n = _export_replacing(operations, output_path)
+    print(f"✅ Import '{input_path}' -> Export '{output_path}' ({n} opérations)")
+
+def run_batch_many(input_paths: List[str], output_path: str, max_workers: Optional[int] = None):
+    """Importe plusieurs fichiers en parallèle (un processus par fichier) puis exporte le tout, dans l'ordre donné."""
+    workers = min(len(input_paths), max_workers or os.cpu_count() or 1)
+    # Les processus renvoient des colonnes (listes) : moins coûteuses à sérialiser que des dataclasses
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(import_columns_from_csv, input_paths))
+    cols = {field: [] for field in _FIELDS}
+    for part in parts:
+        for field in _FIELDS:
+            cols[field].extend(part[field])
+    n = _export_replacing(map(OperationBancaire, *(cols[field] for field in _FIELDS)), output_path)
+    print(f"✅ Import de {len(input_paths)} fichiers -> Export '{output_path}' ({n} opérations)")
 
 # ---------------------- Entry ----------------------
 
@@ -326,8 +373,21 @@ def main():
     parser = argparse.ArgumentParser(description="Import/clean bank CSVs.")
     parser.add_argument("--in", dest="input_path", help="Chemin du fichier CSV en entrée")
     parser.add_argument("--out", dest="output_path", help="Chemin du CSV nettoyé en sortie")
+    parser.add_argument("--merge", dest="input_paths", nargs="+", help="Plusieurs CSV importés en parallèle, fusionnés dans --out")
     args = parser.parse_args()
 
+    if args.input_paths and args.output_path:
+        manquants = [p for p in args.input_paths if not os.path.exists(p)]
+        if manquants:
+            print(f"❌ Fichier introuvable: {', '.join(manquants)}")
+            sys.exit(1)
+        try:
+            run_batch_many(args.input_paths, args.output_path)
+        except Exception as e:
+            print(f"❌ Erreur: {e}")
+            sys.exit(2)
+        sys.exit(0)
+
     if args.input_path and args.output_path:
         if not os.path.exists(args.input_path):
             print(f"❌ Fichier introuvable: {args.input_path}")
@@ -3,18 +3,48 @@
 
 from __future__ import annotations
 
+import queue
+import threading
 import tkinter as tk
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
 
 from main04 import (
     OperationBancaire,
-    agreger_par_categorie,
-    agreger_par_sous_categorie,
+    OperationsView,
+    agreger_par_categorie_et_sous_categorie,
     export_operations_to_csv,
-    import_operations_from_csv,
+    iter_operations_from_csv,
 )
 
+# Lignes réellement insérées dans le Treeview des opérations (le reste est virtuel)
+_WINDOW_ROWS = 50
+
+# Délai (ms) sans frappe avant de réappliquer le filtre de recherche
+_SEARCH_DELAY_MS = 150
+
+# Période (ms) de scrutation du chargement en arrière-plan
+_LOAD_POLL_MS = 50
+# Opérations transmises par lot du thread de chargement à l'interface
+_LOAD_CHUNK = 5000
+
+# Insertion d'un lot de lignes en un seul appel Python -> Tcl : rows = {iid valeurs iid valeurs ...}
+_BULK_INSERT = "budget_bulk_insert"
+_BULK_INSERT_PROC = (
+    f"proc {_BULK_INSERT} {{w index rows}} {{"
+    " foreach {id values} $rows { $w insert {} $index -id $id -values $values } }"
+)
+
+# Séparateur décimal français, appliqué par str.translate
+_DEC_TRANS = str.maketrans(".", ",")
+
+@lru_cache(maxsize=4096)
+def _format_amount_cached(value: float, signed: bool) -> str:
+    return format(value, "+.2f" if signed else ".2f").translate(_DEC_TRANS)
+
 
 class BudgetApp(tk.Tk):
     """Application principale pour visualiser les opérations bancaires."""
@@ -24,8 +54,26 @@ class BudgetApp(tk.Tk):
         self.title("Analyse budgétaire - Import CSV")
         self.geometry("980x640")
         self.minsize(860, 540)
-
-        self.operations: list[OperationBancaire] = []
+        self.tk.eval(_BULK_INSERT_PROC)
+
+        self.operations: OperationsView = OperationsView.empty()
+        # Texte recherché par opération (libellé, catégorie, sous-catégorie), déjà en minuscules
+        self._haystacks: list[str] = []
+        # Valeurs déjà formatées de chaque opération, dans l'ordre des colonnes du Treeview
+        self._row_cache: list[tuple[str, ...]] = []
+        self._total_debit = 0.0
+        self._total_credit = 0.0
+        # Levé quand les totaux changent : total_var n'est réécrite (et ses traces Tk déclenchées) qu'alors
+        self._totals_dirty = False
+        # Incrémentée à chaque nouvel import : invalide les résultats mis en cache
+        self._data_version = 0
+        self._agg_cache: tuple[int, dict, dict] | None = None
+        # Lignes filtrées, affichées par fenêtre à partir de la ligne _first
+        self._visible_rows: list[tuple[str, ...]] = []
+        self._first = 0
+        self._shown_rows = 16
+        self._search_after_id: str | None = None
+        self._loading = False
 
         self._create_widgets()
 
@@ -43,6 +91,8 @@ class BudgetApp(tk.Tk):
 
         self.status_var = tk.StringVar(value="Aucun fichier chargé")
         ttk.Label(toolbar, textvariable=self.status_var).pack(side=tk.LEFT, padx=12)
+        # Affichée seulement pendant un chargement
+        self.progress = ttk.Progressbar(toolbar, mode="indeterminate", length=120)
 
         # Ajout du champ de recherche
         search_frame = ttk.Frame(self, padding=(10, 0))
@@ -66,6 +116,7 @@ class BudgetApp(tk.Tk):
                 ("debit", "Débit"),
                 ("credit", "Crédit"),
             ),
+            virtual=True,
         )
         notebook.add(self.tree_operations.master, text="Opérations")
 
@@ -99,7 +150,9 @@ class BudgetApp(tk.Tk):
         self.total_var = tk.StringVar(value="Débit 0,00 € | Crédit 0,00 € | Solde 0,00 €")
         ttk.Label(bottom, textvariable=self.total_var).pack(side=tk.LEFT, padx=(8, 0))
 
-    def _build_tree(self, parent: ttk.Notebook, columns: tuple[tuple[str, str], ...]) -> ttk.Treeview:
+    def _build_tree(
+        self, parent: ttk.Notebook, columns: tuple[tuple[str, str], ...], *, virtual: bool = False
+    ) -> ttk.Treeview:
         frame = ttk.Frame(parent)
         tree = ttk.Treeview(
             frame,
@@ -107,9 +160,18 @@ class BudgetApp(tk.Tk):
             show="headings",
             height=16,
         )
-        yscroll = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
         xscroll = ttk.Scrollbar(frame, orient=tk.HORIZONTAL, command=tree.xview)
-        tree.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
+        if virtual:
+            # La barre verticale pilote la fenêtre de lignes, pas la vue du Treeview
+            yscroll = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self._scroll_operations)
+            tree.configure(yscrollcommand=self._on_operations_yview, xscrollcommand=xscroll.set)
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                tree.bind(sequence, self._on_operations_wheel)
+            tree.bind("<Configure>", lambda event: self._sync_window())
+            self._ops_scroll = yscroll
+        else:
+            yscroll = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
+            tree.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
 
         tree.grid(row=0, column=0, sticky="nsew")
         yscroll.grid(row=0, column=1, sticky="ns")
@@ -125,30 +187,94 @@ class BudgetApp(tk.Tk):
 
     # ---------------------------------------------------------------- Actions --
     def open_csv(self) -> None:
+        if self._loading:
+            return
         path = filedialog.askopenfilename(
             filetypes=[("Fichiers CSV", "*.csv"), ("Tous les fichiers", "*.*")]
         )
         if not path:
             return
 
+        # Lecture dans un thread, affichée lot par lot : la boucle Tk continue de répondre
+        self._loading = True
+        previous_status = self.status_var.get()
+        self.status_var.set(f"Chargement de {Path(path).name}…")
+        self.progress.pack(side=tk.LEFT)
+        self.progress.start(10)
+        results: queue.Queue = queue.Queue()
+        threading.Thread(target=self._load_worker, args=(path, results), daemon=True).start()
+        self.after(_LOAD_POLL_MS, self._poll_load, path, results, previous_status, None)
+
+    @staticmethod
+    def _load_worker(path: str, results: queue.Queue) -> None:
+        """Thread de chargement : ne touche pas à Tk, dépose ("batch"|"done"|"error", donnée) dans la file."""
+        try:
+            batch = []
+            for op in iter_operations_from_csv(path):
+                batch.append(op)
+                if len(batch) == _LOAD_CHUNK:
+                    results.put(("batch", batch))
+                    batch = []
+            results.put(("done", batch))
+        except Exception as exc:
+            results.put(("error", exc))
+
+    def _poll_load(self, path: str, results: queue.Queue, previous_status: str, restore: tuple | None) -> None:
+        """Consomme un message du thread de chargement ; restore = données remplacées (None avant le 1er lot)."""
         try:
-            self.operations = import_operations_from_csv(path)
-        except FileNotFoundError:
-            messagebox.showerror("Erreur", f"Fichier introuvable :\n{path}")
+            kind, payload = results.get_nowait()
+        except queue.Empty:
+            self.after(_LOAD_POLL_MS, self._poll_load, path, results, previous_status, restore)
             return
-        except ValueError as exc:
-            messagebox.showerror("Erreur de format", f"Le fichier CSV est mal formé :\n{exc}")
+
+        if kind == "error":
+            self._end_loading()
+            if restore is not None:
+                # Import interrompu : on revient aux opérations d'avant
+                self._swap_operations(*restore)
+                self._refresh_operations()
+                self._refresh_aggregations()
+                self._update_totals()
+            self.status_var.set(previous_status)
+            if isinstance(payload, FileNotFoundError):
+                messagebox.showerror("Erreur", f"Fichier introuvable :\n{path}")
+            elif isinstance(payload, ValueError):
+                messagebox.showerror("Erreur de format", f"Le fichier CSV est mal formé :\n{payload}")
+            else:
+                messagebox.showerror("Erreur", f"Impossible de charger le fichier :\n{payload}")
             return
-        except Exception as exc:
-            messagebox.showerror("Erreur", f"Impossible de charger le fichier :\n{exc}")
+
+        if restore is None:
+            # Premier lot : l'import précédent est remplacé, mais conservé jusqu'à la fin du chargement
+            restore = self._swap_operations(OperationsView.empty(), [], [], 0.0, 0.0)
+            self._append_operations(payload)
+            self._refresh_operations()
+        else:
+            start = len(self._row_cache)
+            self._append_operations(payload)
+            if self._visible_rows is not self._row_cache:
+                self._visible_rows.extend(self._filter_rows(self.search_var.get(), start))
+            self._sync_window()
+        self._update_totals()
+
+        if kind == "batch":
+            self.status_var.set(f"Chargement de {Path(path).name}… {len(self.operations)} opérations")
+            self.after(0, self._poll_load, path, results, previous_status, restore)
             return
 
+        self._end_loading()
         self.status_var.set(f"{Path(path).name} — {len(self.operations)} opérations")
-        self._refresh_operations()
         self._refresh_aggregations()
-        self._update_totals()
+
+    def _end_loading(self) -> None:
+        self._loading = False
+        self.progress.stop()
+        self.progress.pack_forget()
 
     def export_csv(self) -> None:
+        if self._loading:
+            messagebox.showinfo("Export", "Chargement en cours : export possible une fois l'import terminé.")
+            return
         if not self.operations:
             messagebox.showinfo("Export", "Aucune opération à exporter.")
             return
@@ -180,303 +306,150 @@ class BudgetApp(tk.Tk):
     def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
         if value is None:
             return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
+        # 0.0 et -0.0 partagent la même clé de cache mais ne s'affichent pas pareil
+        if not value:
+            return format(value, "+.2f" if signed else ".2f").translate(_DEC_TRANS)
+        # Montants récurrents (abonnements, frais) servis par le cache
+        return _format_amount_cached(value, signed)
 
     # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
+    def _swap_operations(self, operations, haystacks, row_cache, total_debit, total_credit) -> tuple:
+        """Installe un jeu d'opérations avec ses index ; renvoie celui qu'il remplace."""
+        previous = (self.operations, self._haystacks, self._row_cache, self._total_debit, self._total_credit)
+        self.operations, self._haystacks, self._row_cache = operations, haystacks, row_cache
+        self._total_debit, self._total_credit = total_debit, total_credit
+        self._data_version += 1
+        self._totals_dirty = True
+        return previous
 
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
+    def _append_operations(self, batch: list[OperationBancaire]) -> None:
+        """Ajoute un lot importé et précalcule, une fois, ce qui ne dépend que de ses opérations."""
+        self._data_version += 1
+        self.operations.extend(batch)
+        # Champs séparés par \0 : une requête saisie ne peut pas chevaucher deux champs
+        self._haystacks.extend(
+            f"{op.libelle_simplifie or op.libelle_operation or ''}\0{op.categorie or ''}\0{op.sous_categorie or ''}".lower()
+            for op in batch
         )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
+        fmt = self._fmt_amount  # résolu une fois pour tout le lot
+        self._row_cache.extend(
+            (
+                op.date_comptabilisation,
+                op.libelle_simplifie or op.libelle_operation,
+                op.categorie,
+                op.sous_categorie,
+                fmt(op.debit),
+                fmt(op.credit),
+            )
+            for op in batch
+        )
+        # Sommes courantes, poursuivies dans l'ordre des lignes d'un lot à l'autre
+        self._total_debit = sum((op.debit or 0.0 for op in batch), self._total_debit)
+        self._total_credit = sum((op.credit or 0.0 for op in batch), self._total_credit)
+        self._totals_dirty = True
+
+    def _filter_rows(self, query: str, start: int = 0) -> list[tuple[str, ...]]:
+        """Lignes en cache (à partir du rang start) dont le texte contient la requête."""
+        query = query.lower().strip()
+        rows = self._row_cache
+        if not query:
+            return rows[start:] if start else rows
+        haystacks = self._haystacks
+        if start:
+            rows, haystacks = islice(rows, start, None), islice(haystacks, start, None)
+        return [row for row, haystack in zip(rows, haystacks) if query in haystack]
+
+    # ------------------------------------------------------------ Rafraîchit --
+    def _refresh_operations(self) -> None:
+        tree = self.tree_operations
+        old = self._visible_rows
+        rows = self._visible_rows = self._filter_rows(self.search_var.get())
+        self._first = 0
+        # Tête de fenêtre inchangée (mêmes tuples du cache, aux mêmes rangs) : les items restent en place
+        have = tree.get_children()
+        keep = 0
+        if have and have[0] == "0":
+            for i in range(min(len(have), len(rows), len(old))):
+                if rows[i] is not old[i]:
+                    break
+                keep += 1
+        if keep < len(have):
+            tree.delete(*have[keep:])
+        self._sync_window()
+
+    def _sync_window(self) -> None:
+        """Ne garde dans le Treeview que les lignes de la fenêtre courante (iid = rang filtré)."""
+        tree = self.tree_operations
+        rows = self._visible_rows
+        n = len(rows)
+        first = self._first = max(0, min(self._first, n - self._shown_rows))
+        last = min(n, first + _WINDOW_ROWS)
+
+        # Seul le delta avec la fenêtre déjà insérée passe par Tcl
+        have = tree.get_children()
+        if have and int(have[0]) < last and first <= int(have[-1]):
+            lo, hi = int(have[0]), int(have[-1]) + 1
+            drop = have[: max(0, first - lo)] + have[len(have) - max(0, hi - last):]
+            if drop:
+                tree.delete(*drop)
+            lo, hi = max(lo, first), min(hi, last)
+        else:
+            if have:
+                self._clear_tree(tree)
+            lo = hi = first
+        if first < lo:
+            self._bulk_insert(tree, 0, [(str(i), rows[i]) for i in range(lo - 1, first - 1, -1)])
+        if hi < last:
+            self._bulk_insert(tree, tk.END, [(str(i), rows[i]) for i in range(hi, last)])
+        tree.yview_moveto(0)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self) -> None:
+        n = len(self._visible_rows)
+        if n:
+            self._ops_scroll.set(self._first / n, min(1.0, (self._first + self._shown_rows) / n))
+        else:
+            self._ops_scroll.set(0.0, 1.0)
+
+    def _scroll_operations(self, *args) -> None:
+        """Commande de la barre verticale : « moveto f » ou « scroll n units|pages »."""
+        if args[0] == "moveto":
+            self._first = int(float(args[1]) * len(self._visible_rows))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._shown_rows
+            self._first += step
+        self._sync_window()
+
+    def _on_operations_wheel(self, event) -> str:
+        self._scroll_operations("scroll", -3 if event.num == 4 or event.delta > 0 else 3, "units")
+        return "break"
+
+    def _on_operations_yview(self, top: str, bottom: str) -> None:
+        """yscrollcommand du Treeview : mesure la hauteur utile et reporte le défilement interne."""
+        count = len(self.tree_operations.get_children())
+        if not count:
+            self._update_scrollbar()
+            return
+        top, bottom = float(top), float(bottom)
+        if top > 0:
+            # Défilement interne (clavier, sélection) : on décale la fenêtre virtuelle
+            self._first += round(top * count)
+            self._sync_window()
+            return
+        if bottom < 1.0 or count >= self._shown_rows:
+            self._shown_rows = max(1, round(bottom * count))
+        self._update_scrollbar()
 
     def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
+        # Les deux agrégations en une passe, recalculées seulement si les opérations ont changé
+        cache = self._agg_cache
+        if cache is None or cache[0] != self._data_version:
+            cache = self._agg_cache = (self._data_version, *agreger_par_categorie_et_sous_categorie(self.operations))
+        _, cats, sous = cache
         self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
 
-        sous = agreger_par_sous_categorie(self.operations)
         self._fill_aggregation_tree(
             self.tree_sous_categories, sous, key_label="sous_categorie"
         )
@@ -488,2877 +461,53 @@ class BudgetApp(tk.Tk):
         *,
         key_label: str,
     ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
+        self._clear_tree(tree)
+        # Solde calculé une fois par ligne : clé de tri (via itemgetter) et colonne affichée
+        ranked = [(name, values, values["total_credit"] - values["total_debit"]) for name, values in data.items()]
+        ranked.sort(key=itemgetter(2), reverse=True)
+        self._bulk_insert(
+            tree,
+            tk.END,
+            [
+                (
+                    str(rank),
+                    (
+                        name,
+                        values.get("nombre", 0),
+                        self._fmt_amount(values["total_debit"]),
+                        self._fmt_amount(values["total_credit"]),
+                        self._fmt_amount(solde, signed=True),
+                    ),
+                )
+                for rank, (name, values, solde) in enumerate(ranked)
+            ],
         )
 
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
+    def _clear_tree(self, tree: ttk.Treeview) -> None:
+        """Vide le Treeview en une commande Tcl : la liste des iids ne transite pas par Python."""
+        self.tk.eval(f"{tree._w} delete [{tree._w} children {{}}]")
 
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
+    def _bulk_insert(self, tree: ttk.Treeview, index, rows: list[tuple[str, tuple]]) -> None:
+        """Insère les couples (iid, valeurs) à la position index, dans l'ordre donné."""
+        flat = [item for row in rows for item in row]
+        self.tk.call(_BULK_INSERT, tree._w, index, flat)
 
     def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
+        if not self._totals_dirty:
+            return
+        self._totals_dirty = False
+        debit, credit = self._total_debit, self._total_credit
         solde = credit - debit
         self.total_var.set(
             f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
         )
 
     def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
+        # Une frappe repousse le filtrage : seule la dernière d'une rafale le déclenche
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(_SEARCH_DELAY_MS, self._apply_search)
 
-    def _on_search(self, event=None):
+    def _apply_search(self) -> None:
+        self._search_after_id = None
         self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
-
-    def _refresh_aggregations(self) -> None:
-        cats = agreger_par_categorie(self.operations)
-        self._fill_aggregation_tree(self.tree_categories, cats, key_label="categorie")
-
-        sous = agreger_par_sous_categorie(self.operations)
-        self._fill_aggregation_tree(
-            self.tree_sous_categories, sous, key_label="sous_categorie"
-        )
-
-    def _fill_aggregation_tree(
-        self,
-        tree: ttk.Treeview,
-        data: dict[str, dict[str, float]],
-        *,
-        key_label: str,
-    ) -> None:
-        tree.delete(*tree.get_children())
-        for name, values in sorted(
-            data.items(), key=lambda item: item[1]["total_credit"] - item[1]["total_debit"], reverse=True
-        ):
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    values.get("nombre", 0),
-                    self._fmt_amount(values.get("total_debit")),
-                    self._fmt_amount(values.get("total_credit")),
-                    self._fmt_amount(values.get("total_credit", 0) - values.get("total_debit", 0), signed=True),
-                ),
-            )
-
-    def _update_totals(self) -> None:
-        debit = sum(op.debit or 0.0 for op in self.operations)
-        credit = sum(op.credit or 0.0 for op in self.operations)
-        solde = credit - debit
-        self.total_var.set(
-            f"Débit {self._fmt_amount(debit)} € | Crédit {self._fmt_amount(credit)} € | Solde {self._fmt_amount(solde, signed=True)} €"
-        )
-
-    def _on_search(self, event=None):
-        self._refresh_operations()
-
-    # ----------------------------------------------------------- Utilitaires --
-    @staticmethod
-    def _fmt_amount(value: float | None, *, signed: bool = False) -> str:
-        if value is None:
-            return ""
-        if signed:
-            return f"{value:+.2f}".replace(".", ",")
-        return f"{value:.2f}".replace(".", ",")
-
-    # -------------------- Méthodes utilitaires de tri et filtrage --------------------
-    def _filter_operations(self, operations, query: str):
-        query = query.lower().strip()
-        if not query:
-            return operations
-        filtered = []
-        for op in operations:
-            libelle = (op.libelle_simplifie or op.libelle_operation or "").lower()
-            categorie = (op.categorie or "").lower()
-            sous_categorie = (op.sous_categorie or "").lower()
-            if query in libelle or query in categorie or query in sous_categorie:
-                filtered.append(op)
-        return filtered
-
-    # ------------------------------------------------------------ Rafraîchit --
-    def _refresh_operations(self) -> None:
-        tree = self.tree_operations
-        tree.delete(*tree.get_children())
-        filtered_ops = self._filter_operations(self.operations, self.search_var.get())
-        for op in filtered_ops:
-            tree.insert(
-                "",
-                tk.END,
-                values=(
-                    op.date_comptabilisation,
-                    op.libelle_simplifie or op.libelle_operation,
-                    op.categorie,
-                    op.sous_categorie,
-                    self._fmt_amount(op.debit),
-                    self._fmt_amount(op.credit),
-                ),
-            )
\ No newline at end of file
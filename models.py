@@ -1,7 +1,7 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class OperationBancaire:
     date_comptabilisation: str = ""
     libelle_simplifie: str = ""
@@ -15,9 +15,12 @@ class OperationBancaire:
     credit: Optional[float] = None
 
     def to_dict_export(self):
-        d = asdict(self)
-        if d["debit"] is not None:
-            d["debit"] = f"{d['debit']:.2f}"
-        if d["credit"] is not None:
-            d["credit"] = f"{d['credit']:.2f}"
+        # Sans asdict() : pas de copie récursive par opération
+        d = {field: getattr(self, field) for field in _FIELDS}
+        if self.debit is not None:
+            d["debit"] = f"{self.debit:.2f}"
+        if self.credit is not None:
+            d["credit"] = f"{self.credit:.2f}"
         return d
+
+_FIELDS = tuple(f.name for f in fields(OperationBancaire))
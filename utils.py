@@ -1,32 +1,85 @@
 import unicodedata
 import re
 import csv
+from functools import lru_cache
+from typing import IO, Optional, Union
+
+class _MarkDeleter(dict):
+    """Table str.translate qui supprime les diacritiques (catégorie Mn), remplie à la demande."""
+
+    def __missing__(self, cp: int):
+        value = self[cp] = None if unicodedata.category(chr(cp)) == "Mn" else cp
+        return value
+
+_STRIP_MARKS = _MarkDeleter()
 
 def strip_accents(s: str) -> str:
     if s is None:
         return ""
-    return "".join(c for c in unicodedata.normalize("NFD", str(s)) if unicodedata.category(c) != "Mn")
+    s = str(s)
+    if s.isascii():
+        return s
+    return unicodedata.normalize("NFD", s).translate(_STRIP_MARKS)
 
+# Espaces/ponctuation et underscores consécutifs -> un seul underscore
+_HEADER_SEP_RE = re.compile(r"[\W_]+")
+
+@lru_cache(maxsize=256)
 def normalize_header(h: str) -> str:
     h = strip_accents(h).lower().strip()
-    h = re.sub(r"[^\w]+", "_", h)  # espaces/ponctuation -> underscore
-    h = re.sub(r"_+", "_", h).strip("_")
-    return h
+    return _HEADER_SEP_RE.sub("_", h).strip("_")
+
+# Taille (en caractères) de l'échantillon analysé par le Sniffer
+_SNIFF_SIZE = 4096
+
+def _read_sample(f: IO[str]) -> str:
+    """Échantillon d'un fichier texte déjà ouvert, puis retour au début pour le lecteur."""
+    # Fins de ligne universelles, comme une lecture en mode texte par défaut, même si f a newline=""
+    sample = f.read(2 * _SNIFF_SIZE).replace("\r\n", "\n").replace("\r", "\n")[:_SNIFF_SIZE]
+    f.seek(0)
+    return sample
+
+# Séparateurs candidats, par ordre de préférence en cas d'égalité (relevés SEPA : ";")
+_DELIMITERS = ";,|\t"
+
+@lru_cache(maxsize=None)
+def _simple_dialect(delimiter: str) -> csv.Dialect:
+    """Dialecte CSV standard (guillemets doubles) pour le séparateur donné."""
+    return type("Simple", (csv.Dialect,), {
+        "delimiter": delimiter,
+        "quotechar": '"',
+        "doublequote": True,
+        "skipinitialspace": True,
+        "lineterminator": "\n",
+        "quoting": csv.QUOTE_MINIMAL,
+    })()
+
+def _guess_delimiter(sample: str) -> Optional[str]:
+    """Séparateur évident de la ligne d'en-tête d'un échantillon sans guillemets, ou None s'il faut le Sniffer."""
+    if '"' in sample or "'" in sample:
+        return None  # un séparateur peut se cacher entre guillemets, et le Sniffer en déduit le quotechar
+    first_line = sample.split("\n", 1)[0]
+    counts = sorted(((first_line.count(d), d) for d in _DELIMITERS), key=lambda c: c[0], reverse=True)
+    (best, delimiter), (second, _) = counts[0], counts[1]
+    if best >= 2 and best > second:
+        return delimiter
+    return None
 
-def detect_dialect(path: str) -> csv.Dialect:
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
-        sample = f.read(4096)
+def detect_dialect(source: Union[str, IO[str]]) -> csv.Dialect:
+    """Dialecte d'un CSV, depuis son chemin ou depuis le fichier texte déjà ouvert par l'appelant."""
+    if isinstance(source, str):
+        with open(source, "r", encoding="utf-8", errors="replace") as f:
+            sample = f.read(_SNIFF_SIZE)
+    else:
+        sample = _read_sample(source)
+    delimiter = _guess_delimiter(sample)
+    if delimiter is not None:
+        return _simple_dialect(delimiter)
     try:
         sniffer = csv.Sniffer()
-        dialect = sniffer.sniff(sample, delimiters=";,|\t,")
+        dialect = sniffer.sniff(sample, delimiters=_DELIMITERS)
         dialect.doublequote = True
         dialect.skipinitialspace = True
         return dialect
     except Exception:
-        class SemiColon(csv.Dialect):
-            delimiter = ";"
-            quotechar = '"'
-            doublequote = True
-            skipinitialspace = True
-            lineterminator = "\n"
-        return SemiColon()
+        return _simple_dialect(";")